@@ -0,0 +1,53 @@
+"""
+Benchmarks for date validation.
+
+Run from the repository root with ``python -m benchmarks.dateValidator_benchmark``.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from codonPython.validation.dateValidator import parseDates, validDate, validDates
+
+
+def make_dates(rows: int = 1000000, seed: int = 42) -> pd.Series:
+    """Mostly valid `dd/mm/yyyy` dates, with some days past the end of the month."""
+
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(
+        pd.Timestamp("1900-01-01") + pd.to_timedelta(rng.integers(0, 365 * 150, size=rows), unit="D")
+    ).dt.strftime("%d/%m/%Y")
+    return dates.where(rng.random(rows) >= 0.05, "31" + dates.str[2:])
+
+
+def benchmark_validation(rows: int = 1000000):
+    dates = make_dates(rows)
+    scalar = min(timeit.repeat(lambda: dates.map(validDate), number=1, repeat=3))
+    vectorised = min(timeit.repeat(lambda: validDates(dates), number=1, repeat=3))
+
+    print(f"Validating {rows:,} dates")
+    print(f"  validDate row by row: {scalar:8.3f}s")
+    print(f"  validDates:           {vectorised:8.3f}s")
+    print(f"  speed up: {scalar / vectorised:,.1f}x")
+
+
+def benchmark_parsing(rows: int = 1000000):
+    dates = make_dates(rows)
+
+    def validate_then_parse():
+        valid = dates.map(validDate)
+        return pd.to_datetime(dates.where(valid), format="%d/%m/%Y"), valid
+
+    separate = min(timeit.repeat(validate_then_parse, number=1, repeat=3))
+    combined = min(timeit.repeat(lambda: parseDates(dates), number=1, repeat=3))
+
+    print(f"Validating and parsing {rows:,} dates")
+    print(f"  validDate then pd.to_datetime: {separate:8.3f}s")
+    print(f"  parseDates:                    {combined:8.3f}s")
+    print(f"  speed up: {separate / combined:,.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark_validation()
+    benchmark_parsing()
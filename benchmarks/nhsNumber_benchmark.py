@@ -0,0 +1,79 @@
+"""
+Benchmarks for NHS Number validation.
+
+Run from the repository root with ``python -m benchmarks.nhsNumber_benchmark``.
+"""
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from codonPython.nhsNumber import (
+    nhsNumberArrayGenerator,
+    nhsNumberArrayValidator,
+    nhsNumberStringValidator,
+    nhsNumberValidator,
+)
+
+
+def benchmark_validation(rows: int = 1000000, scalar_rows: int = 100000):
+    numbers = np.random.RandomState(42).randint(1000000000, 9999999999, size=rows)
+
+    # The scalar function is timed on a sample and scaled up, as a full loop is slow.
+    scalar_sample = [int(number) for number in numbers[:scalar_rows]]
+    scalar = timeit.timeit(
+        lambda: [nhsNumberValidator(number) for number in scalar_sample], number=1
+    ) * (rows / scalar_rows)
+    vectorised = min(
+        timeit.repeat(lambda: nhsNumberArrayValidator(numbers), number=1, repeat=5)
+    )
+
+    print(f"Validating {rows:,} NHS Numbers")
+    print(f"  nhsNumberValidator loop (estimated): {scalar:8.3f}s")
+    print(f"  nhsNumberArrayValidator:             {vectorised:8.3f}s")
+    print(f"  speed up: {scalar / vectorised:,.0f}x")
+
+
+def benchmark_string_validation(rows: int = 1000000, scalar_rows: int = 100000):
+    numbers = pd.Series(
+        np.random.RandomState(42).randint(1000000000, 9999999999, size=rows).astype(str)
+    )
+    formatted = numbers.str[:3] + " " + numbers.str[3:6] + " " + numbers.str[6:]
+
+    # Cleaning each row then calling the scalar validator, as done before.
+    sample = formatted[:scalar_rows]
+    scalar = timeit.timeit(
+        lambda: [nhsNumberValidator(int(value.replace(" ", ""))) for value in sample],
+        number=1,
+    ) * (rows / scalar_rows)
+    vectorised = min(
+        timeit.repeat(lambda: nhsNumberStringValidator(formatted), number=1, repeat=3)
+    )
+
+    print(f"Validating {rows:,} formatted NHS Number strings")
+    print(f"  str.replace, int and nhsNumberValidator (estimated): {scalar:8.3f}s")
+    print(f"  nhsNumberStringValidator:                            {vectorised:8.3f}s")
+    print(f"  speed up: {scalar / vectorised:,.0f}x")
+
+
+def benchmark_workers(rows: int = 50000000, workers: int = os.cpu_count()):
+    serial_generate = timeit.timeit(lambda: nhsNumberArrayGenerator(rows, 42), number=1)
+    parallel_generate = timeit.timeit(
+        lambda: nhsNumberArrayGenerator(rows, 42, workers=workers), number=1
+    )
+    numbers = nhsNumberArrayGenerator(rows, 42)
+    serial_validate = timeit.timeit(lambda: nhsNumberArrayValidator(numbers), number=1)
+    parallel_validate = timeit.timeit(
+        lambda: nhsNumberArrayValidator(numbers, workers=workers), number=1
+    )
+
+    print(f"Generating and validating {rows:,} NHS Numbers with {workers} workers")
+    print(f"  nhsNumberArrayGenerator: {serial_generate:8.3f}s serial, {parallel_generate:8.3f}s parallel")
+    print(f"  nhsNumberArrayValidator: {serial_validate:8.3f}s serial, {parallel_validate:8.3f}s parallel")
+
+
+if __name__ == "__main__":
+    benchmark_validation()
+    benchmark_string_validation()
+    benchmark_workers()
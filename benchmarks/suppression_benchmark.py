@@ -0,0 +1,62 @@
+"""
+Benchmarks for table suppression.
+
+Run from the repository root with ``python -m benchmarks.suppression_benchmark``.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from codonPython.suppression import secondary_suppression
+
+
+def make_table(providers: int = 100000, measures: int = 100, seed: int = 42) -> pd.DataFrame:
+    """
+    Long format table of England, 10 regions, 100 sub-regions and `providers` providers,
+    for `measures` - 1 measures and a total measure. Parent values are sums of children.
+    """
+
+    rng = np.random.default_rng(seed)
+    provider_parents = np.repeat([f"S{i}" for i in range(100)], providers // 100)
+    geographies = pd.DataFrame(
+        {
+            "Org_Code": ["ENG"] + [f"R{i}" for i in range(10)] + [f"S{i}" for i in range(100)]
+            + [f"P{i}" for i in range(len(provider_parents))],
+            "Parent_Code": [None] + ["ENG"] * 10 + [f"R{i // 10}" for i in range(100)]
+            + list(provider_parents),
+        }
+    )
+    measure_names = [f"m{i}" for i in range(measures - 1)]
+
+    # Provider values for each measure, then totals up the hierarchy and across measures.
+    provider_values = pd.DataFrame(
+        rng.poisson(30, size=(len(provider_parents), len(measure_names))),
+        index=geographies["Org_Code"].iloc[111:],
+        columns=measure_names,
+    )
+    sub_regions = provider_values.groupby(provider_parents).sum()
+    regions = sub_regions.groupby([f"R{int(code[1:]) // 10}" for code in sub_regions.index]).sum()
+    england = regions.sum().to_frame("ENG").T
+    wide = pd.concat([england, regions, sub_regions, provider_values])
+    wide["Total"] = wide.sum(axis=1)
+
+    table = wide.rename_axis("Org_Code").reset_index().melt(
+        id_vars="Org_Code", var_name="Measure", value_name="Value_Unsuppressed"
+    )
+    return table.merge(geographies, on="Org_Code")
+
+
+def benchmark_secondary_suppression():
+    for providers in (1000, 10000, 100000):
+        table = make_table(providers)
+        elapsed = min(
+            timeit.repeat(
+                lambda: secondary_suppression(table, total_measure="Total"), number=1, repeat=3
+            )
+        )
+        print(f"secondary_suppression on {len(table):>11,} cells: {elapsed:8.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark_secondary_suppression()
@@ -0,0 +1,82 @@
+"""
+Benchmarks for tolerance checking.
+
+Run from the repository root with ``python -m benchmarks.tolerance_benchmark``.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from codonPython.validation.tolerance import check_tolerance, check_tolerance_grouped
+
+
+def make_series(series: int = 10000, points: int = 24, seed: int = 42) -> pd.DataFrame:
+    """Long format monthly series for organisations and measures, with some shorter series."""
+
+    rng = np.random.default_rng(seed)
+    lengths = rng.choice([points, points - 6, points - 12], size=series)
+    group = np.repeat(np.arange(series), lengths)
+    t = np.concatenate([np.arange(length) for length in lengths])
+    trend = rng.normal(100, 20, size=series)[group] + rng.normal(1, 0.5, size=series)[group] * t
+    return pd.DataFrame(
+        {
+            "org": group // 10,
+            "measure": group % 10,
+            "t": t + 1000,
+            "y": trend + rng.normal(0, 5, size=len(t)),
+        }
+    )
+
+
+def loop(data: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat(
+        [
+            check_tolerance(series["t"].reset_index(drop=True), series["y"].reset_index(drop=True)).assign(
+                org=org, measure=measure
+            )
+            for (org, measure), series in data.groupby(["org", "measure"])
+        ],
+        ignore_index=True,
+    )
+
+
+def benchmark_grouped(series: int = 10000, looped_series: int = 500):
+    data = make_series(series)
+    looped_data = make_series(looped_series)
+
+    looped = min(timeit.repeat(lambda: loop(looped_data), number=1, repeat=3))
+    grouped_small = min(
+        timeit.repeat(lambda: check_tolerance_grouped(looped_data, ["org", "measure"]), number=1, repeat=3)
+    )
+    grouped = min(timeit.repeat(lambda: check_tolerance_grouped(data, ["org", "measure"]), number=1, repeat=3))
+
+    print("Tolerance checks with linear and quadratic fits")
+    print(f"  check_tolerance, {looped_series:>6,} series:         {looped:8.3f}s")
+    print(f"  check_tolerance_grouped, {looped_series:>6,} series: {grouped_small:8.3f}s")
+    print(f"  check_tolerance_grouped, {series:>6,} series: {grouped:8.3f}s")
+    print(f"  speed up per series: {looped / looped_series / (grouped / series):,.0f}x")
+
+
+def benchmark_calls(calls: int = 500):
+    """Time per check_tolerance call over many calls, with more polynomial degrees each time."""
+
+    data = make_series(calls)
+    series = [
+        (group["t"].reset_index(drop=True), group["y"].reset_index(drop=True))
+        for _, group in data.groupby(["org", "measure"])
+    ]
+
+    print(f"check_tolerance over {calls:,} calls")
+    for poly_features in ([1], [1, 2], [1, 2, 3, 4]):
+        seconds = min(
+            timeit.repeat(
+                lambda: [check_tolerance(t, y, poly_features=poly_features) for t, y in series], number=1, repeat=3
+            )
+        )
+        print(f"  degrees {str(poly_features):<14} {1000 * seconds / calls:8.3f}ms per call")
+
+
+if __name__ == "__main__":
+    benchmark_calls()
+    benchmark_grouped()
@@ -0,0 +1,147 @@
+"""
+Benchmarks for the validation checks.
+
+Run from the repository root with ``python -m benchmarks.validation_benchmark``.
+"""
+import os
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from codonPython.validation.batch import run_batch
+from codonPython.validation.cache import AggregateCache
+from codonPython.validation.check_consistent_measures import check_consistent_measures
+from codonPython.validation.check_consistent_submissions import check_consistent_submissions
+from codonPython.validation.check_nat_val import check_nat_val
+from codonPython.validation.suite import ValidationSuite
+
+
+def make_submission(rows: int = 5000000, measures: int = 50, seed: int = 42) -> pd.DataFrame:
+    """Long format submission with geography levels, measures and values as strings and integers."""
+
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Org_Level": rng.choice(["National", "Region", "CCG", "Provider"], size=rows),
+            "Measure": rng.choice([f"m{i}" for i in range(measures)], size=rows).astype(object),
+            "Value_Unsuppressed": rng.integers(0, 1000, size=rows),
+        }
+    )
+
+
+def benchmark_suite(rows: int = 5000000):
+    data = make_submission(rows)
+
+    def separately():
+        return (
+            check_consistent_measures(data),
+            check_consistent_submissions(data),
+            check_nat_val(data, breakdown_col="Org_Level"),
+        )
+
+    separate = min(timeit.repeat(separately, number=1, repeat=3))
+    suite = min(timeit.repeat(lambda: ValidationSuite(data).run(), number=1, repeat=3))
+
+    print(f"Running the consistency checks on {rows:,} rows")
+    print(f"  three functions:  {separate:8.3f}s")
+    print(f"  ValidationSuite:  {suite:8.3f}s")
+    print(f"  speed up: {separate / suite:,.1f}x")
+
+
+def benchmark_wide_frame(rows: int = 200000, extra_columns: int = 200):
+    """check_consistent_measures on a submission with many other columns, some missing."""
+
+    data = make_submission(rows)
+    rng = np.random.default_rng(42)
+    extra = pd.DataFrame(
+        rng.random((rows, extra_columns)), columns=[f"extra_{i}" for i in range(extra_columns)]
+    ).mask(lambda frame: frame < 0.1)
+    wide = pd.concat([data, extra], axis=1)
+
+    narrow_time = min(timeit.repeat(lambda: check_consistent_measures(data), number=1, repeat=3))
+    wide_time = min(timeit.repeat(lambda: check_consistent_measures(wide), number=1, repeat=3))
+
+    print(f"check_consistent_measures on {rows:,} rows")
+    print(f"  3 columns:   {narrow_time:8.3f}s")
+    print(f"  {extra_columns + 3} columns: {wide_time:8.3f}s")
+
+
+def benchmark_categorical(rows: int = 5000000):
+    """Each check with geography levels and measures as strings and as categories."""
+
+    data = make_submission(rows)
+    categorical = data.astype({"Org_Level": "category", "Measure": "category"})
+    checks = {
+        "check_consistent_measures": check_consistent_measures,
+        "check_consistent_submissions": check_consistent_submissions,
+        "check_nat_val": lambda frame: check_nat_val(frame, breakdown_col="Org_Level"),
+        "ValidationSuite": lambda frame: ValidationSuite(frame).run(),
+    }
+
+    print(f"Checks on {rows:,} rows, strings against categories")
+    for name, check in checks.items():
+        strings = min(timeit.repeat(lambda: check(data), number=1, repeat=3))
+        categories = min(timeit.repeat(lambda: check(categorical), number=1, repeat=3))
+        print(f"  {name:<30} {strings:8.3f}s {categories:8.3f}s")
+
+
+def benchmark_cache(rows: int = 5000000, periods: int = 24):
+    """Re-running the checks on a cumulative submission after the newest period changes."""
+
+    data = make_submission(rows)
+    data["Period"] = np.sort(np.random.default_rng(42).integers(0, periods, size=rows))
+    newest = data["Period"] == periods - 1
+    categorical = data.astype({"Org_Level": "category", "Measure": "category"})
+
+    print(f"Re-running the consistency checks on {rows:,} rows over {periods} periods")
+    for name, frame in {"strings": data, "categories": categorical}.items():
+        cache = AggregateCache(os.path.join(tempfile.mkdtemp(), "aggregates.pkl"))
+        full = min(timeit.repeat(lambda: ValidationSuite(frame).run(), number=1, repeat=3))
+        cold = timeit.timeit(lambda: cache.suite(frame, ["Period"]).run(), number=1)
+
+        def rerun():
+            frame.loc[newest, "Value_Unsuppressed"] += 1
+            return cache.suite(frame, ["Period"]).run()
+
+        warm = min(timeit.repeat(rerun, number=1, repeat=3))
+        print(f"  {name}")
+        print(f"    ValidationSuite:           {full:8.3f}s")
+        print(f"    AggregateCache, empty:     {cold:8.3f}s")
+        print(f"    AggregateCache, 1 changed: {warm:8.3f}s ({cache.recomputed} recomputed)")
+
+
+def benchmark_batch(files: int = 32, rows: int = 200000):
+    """Checks on many submission files, in a serial loop and across worker processes."""
+
+    directory = tempfile.mkdtemp()
+    paths = [os.path.join(directory, f"submission_{i}.csv") for i in range(files)]
+    for seed, path in enumerate(paths):
+        make_submission(rows, seed=seed).to_csv(path, index=False)
+    checks = {
+        "consistent_measures": check_consistent_measures,
+        "consistent_submissions": check_consistent_submissions,
+    }
+
+    def serially():
+        results = []
+        for path in paths:
+            data = pd.read_csv(path)
+            results.append({name: check(data) for name, check in checks.items()})
+        return results
+
+    serial = timeit.timeit(serially, number=1)
+    print(f"Checks on {files} files of {rows:,} rows")
+    print(f"  serial loop:        {serial:8.3f}s")
+    for workers in sorted({1, 2, 4, os.cpu_count()}):
+        batch = timeit.timeit(lambda: run_batch(paths, checks, workers=workers), number=1)
+        print(f"  run_batch, {workers:>2} workers: {batch:8.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark_suite()
+    benchmark_wide_frame()
+    benchmark_categorical()
+    benchmark_cache()
+    benchmark_batch()
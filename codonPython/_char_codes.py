@@ -0,0 +1,32 @@
+import numpy as np
+
+
+def char_codes(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    Character codes of an array of strings, as a uint8 array with one row for each of
+    the first `width` positions and one column for each string. Longer strings are cut
+    to `width` characters and shorter ones padded with code 0. Bytes which are not ASCII
+    are decoded as latin-1.
+
+    Codes above 255 are neither digits nor separators to any of the parsers, so they are
+    capped to keep the arrays small.
+    """
+
+    dtype = "U{}".format(width)
+    try:
+        chars = np.asarray(values, dtype=dtype)
+    except UnicodeDecodeError:
+        # Only bytes that are not ASCII get here; decode them one by one instead.
+        chars = np.asarray(
+            [value.decode("latin-1") if isinstance(value, bytes) else value for value in values],
+            dtype=dtype,
+        )
+    return np.minimum(chars.view(np.uint32).reshape(len(chars), width), 255).astype(np.uint8).T.copy()
+
+
+def code_table(codes: list) -> np.ndarray:
+    """Boolean lookup table over the character codes 0-255, marking `codes`."""
+
+    table = np.zeros(256, dtype=bool)
+    table[codes] = True
+    return table
@@ -1,4 +1,8 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 
 
 def age_band_5_years(age: int) -> str:
@@ -85,3 +89,323 @@ def age_band_10_years(age: int) -> str:
         lowerbound = 10 * int(math.floor(age / 10))
         upperbound = lowerbound + 9
         return "{}-{}".format(lowerbound, upperbound)
+
+
+# Ages from 0 up to, but not including, this limit can be banded.
+_MAX_AGE = 150
+
+
+# Inferred types of object columns which can be treated as numbers.
+_NUMERIC_TYPES = {"integer", "floating", "mixed-integer-float", "decimal", "empty"}
+
+
+@lru_cache(maxsize=None)
+def _compile_banding(edges: tuple, labels: tuple) -> tuple:
+    """
+    Build the lookup table from each age 0-149 to the index of its band, along with the
+    ordered band labels. Cached, so each distinct banding is only compiled once.
+    """
+
+    if not edges or edges[0] != 0:
+        raise ValueError("The first age band must start at 0.")
+    if not all(isinstance(edge, (int, np.integer)) for edge in edges):
+        raise ValueError("Please input whole numbers for the age band edges.")
+    if any(lower >= upper for lower, upper in zip(edges, edges[1:])) or edges[-1] >= _MAX_AGE:
+        raise ValueError(
+            "The age band edges must be increasing and less than {}.".format(_MAX_AGE)
+        )
+    if labels is None:
+        # Single year bands are labelled with just the age.
+        labels = tuple(
+            str(lower) if upper == lower + 1 else "{}-{}".format(lower, upper - 1)
+            for lower, upper in zip(edges, edges[1:])
+        ) + ("{} and over".format(edges[-1]),)
+    if len(labels) != len(edges):
+        raise ValueError("Please input one label for each age band.")
+
+    table = (np.searchsorted(edges, np.arange(_MAX_AGE), side="right") - 1).astype(np.int16)
+    # The table is shared between every AgeBanding with this definition.
+    table.setflags(write=False)
+    return table, labels
+
+
+def _to_ages(ages) -> np.ndarray:
+    """
+    Convert a column of ages to an integer or float array, where missing ages are NaN,
+    raising the same errors as the scalar banding functions.
+    """
+
+    values = ages.to_numpy() if isinstance(ages, pd.Series) else np.asarray(ages)
+    if values.dtype.kind not in "iuf":
+        # Nullable integers and objects such as None go via float, where missing is NaN.
+        values = pd.Series(values, dtype=object)
+        if pd.api.types.infer_dtype(values, skipna=True) not in _NUMERIC_TYPES:
+            raise TypeError("The age inputs must all be numbers or missing.")
+        values = pd.to_numeric(values).to_numpy(dtype=np.float64)
+    return values
+
+
+class AgeBanding:
+    """
+    Age banding scheme, compiled once into a lookup table and reused.
+
+    Bands are defined by the lowest age in each band. The last band is open ended, up to
+    the maximum age of 149. Banding definitions are cached, so constructing the same
+    scheme again does not repeat the work of compiling it.
+
+    Parameters
+    ----------
+    edges : list
+        Increasing whole numbers, starting at 0, giving the lowest age in each band.
+    labels : list, default = None
+        Label for each band. Defaults to labels such as '17', '18-64' and '65 and over'.
+
+    Examples
+    --------
+    >>> banding = AgeBanding([0, 16, 65])
+    >>> banding.band(40)
+    '16-64'
+    >>> banding.band(pd.Series([3, None, 70])).tolist()
+    ['0-15', nan, '65 and over']
+    >>> banding.band(None)
+    'Age not known'
+    >>> AgeBanding([0, 18], labels=["Child", "Adult"]).band([17, 18]).tolist()
+    ['Child', 'Adult']
+    """
+
+    def __init__(self, edges: list, labels: list = None):
+        self.edges = tuple(edges)
+        self._table, self.categories = _compile_banding(
+            self.edges, None if labels is None else tuple(labels)
+        )
+
+    def __repr__(self):
+        return "AgeBanding(edges={}, labels={})".format(
+            list(self.edges), list(self.categories)
+        )
+
+    def band(self, ages):
+        """
+        Place ages into bands.
+
+        A missing single age gives 'Age not known', as for `age_band_5_years`. In a column,
+        missing ages are left missing rather than given a band, so they are left out of
+        ordered comparisons, sorting and the maximum band. A ValueError is raised for any
+        age below 0 or of 150 and over. Non-integer ages are rounded down.
+
+        Parameters
+        ----------
+        ages : int, float, np.ndarray, pd.Series or list
+            Age of a person, or a column of ages. DataFrame columns are passed as Series.
+
+        Returns
+        -------
+        out : str, pd.Categorical or pd.Series
+            The band label for a single age, or ordered Categorical of band labels for a
+            column. A categorical Series, with the same index, is returned when a Series
+            is given.
+        """
+
+        if ages is None or np.ndim(ages) == 0:
+            band = self.band([ages])[0]
+            return "Age not known" if pd.isna(band) else band
+
+        values = _to_ages(ages)
+        missing = np.isnan(values) if values.dtype.kind == "f" else np.zeros(len(values), dtype=bool)
+        return self._band_values(values, missing, ages)
+
+    def _band_values(self, values: np.ndarray, missing: np.ndarray, like):
+        """
+        Band a numeric array of ages, given which are missing, returning a categorical
+        Series like `like` if that is a Series and a Categorical otherwise.
+        """
+
+        known = values[~missing]
+        if (known >= _MAX_AGE).any():
+            raise ValueError("The age input: {} is too large.".format(known[known >= _MAX_AGE][0]))
+        if (known < 0).any():
+            raise ValueError("The age input: {} is too low.".format(known[known < 0][0]))
+
+        # Missing ages take the code -1, which pandas treats as missing.
+        codes = np.full(len(values), -1, dtype=np.int16)
+        codes[~missing] = self._table[known.astype(np.int64)]
+        banded = pd.Categorical.from_codes(codes, categories=self.categories, ordered=True)
+        if isinstance(like, pd.Series):
+            return pd.Series(banded, index=like.index, name=like.name)
+        return banded
+
+
+_AGE_BANDING_5_YEARS = AgeBanding(range(0, 95, 5))
+_AGE_BANDING_10_YEARS = AgeBanding(range(0, 100, 10))
+
+
+def age_band_5_years_array(ages):
+    """
+    Place a column of ages into 5 year bands
+
+    This is the vectorised counterpart of `age_band_5_years`. Ages are mapped through a
+    precomputed table covering ages 0-149, giving an ordered Categorical rather than one
+    string per row. Missing ages are left missing, rather than 'Age not known', so they
+    are left out of ordered comparisons between bands. A ValueError is raised for any age
+    below 0 or of 150 and over.
+
+    Parameters
+    ----------
+    ages : np.ndarray, pd.Series or list
+        Ages of the people, as integers, nullable integers or floats
+
+    Returns
+    -------
+    out : pd.Categorical or pd.Series
+        The ordered 5 year age bands. A categorical Series, with the same index, is
+        returned when a Series is given.
+
+    Examples
+    --------
+    >>> age_band_5_years_array([3, None, 95]).tolist()
+    ['0-4', nan, '90 and over']
+    """
+
+    return _AGE_BANDING_5_YEARS.band(ages)
+
+
+def age_band_10_years_array(ages):
+    """
+    Place a column of ages into 10 year bands
+
+    This is the vectorised counterpart of `age_band_10_years`. Ages are mapped through a
+    precomputed table covering ages 0-149, giving an ordered Categorical rather than one
+    string per row. Missing ages are left missing, rather than 'Age not known', so they
+    are left out of ordered comparisons between bands. A ValueError is raised for any age
+    below 0 or of 150 and over.
+
+    Parameters
+    ----------
+    ages : np.ndarray, pd.Series or list
+        Ages of the people, as integers, nullable integers or floats
+
+    Returns
+    -------
+    out : pd.Categorical or pd.Series
+        The ordered 10 year age bands. A categorical Series, with the same index, is
+        returned when a Series is given.
+
+    Examples
+    --------
+    >>> age_band_10_years_array([3, None, 95]).tolist()
+    ['0-9', nan, '90 and over']
+    """
+
+    return _AGE_BANDING_10_YEARS.band(ages)
+
+
+def _to_datetime64(dates) -> np.ndarray:
+    """Convert a date, or column of dates, to a datetime64[ns] array or scalar."""
+
+    if isinstance(dates, (pd.Series, np.ndarray, list, pd.DatetimeIndex)):
+        dates = pd.Series(dates)
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        return dates.to_numpy(dtype="datetime64[ns]")
+    return pd.Timestamp(dates).to_datetime64()
+
+
+def _civil_from_days(days: np.ndarray) -> tuple:
+    """
+    Calendar year of each day counted from 1970-01-01, and the position of the day within
+    its year as month * 32 + day.
+    """
+
+    # Civil from days algorithm (http://howardhinnant.github.io/date_algorithms.html),
+    # which avoids numpy's slow conversions to month and year units.
+    shifted = days + 719468
+    era = shifted // 146097
+    day_of_era = shifted - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    # Days and months here are counted from 1 March, so leap days fall at the end.
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_from_march = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_from_march + 2) // 5 + 1
+    month = np.where(month_from_march < 10, month_from_march + 3, month_from_march - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month * 32 + day
+
+
+# Precomputed calendar covering the 400 years from 1800, where almost all dates fall.
+_CALENDAR_START = int(np.datetime64("1800-01-01", "D").astype(np.int64))
+_CALENDAR_YEARS, _CALENDAR_DAYS = _civil_from_days(np.arange(_CALENDAR_START, _CALENDAR_START + 146097))
+
+
+def _year_and_day(dates: np.ndarray) -> tuple:
+    """
+    Calendar year of datetime64 dates, and the position of each day within its year as
+    month * 32 + day.
+    """
+
+    # Missing dates are given any valid date, as their results are discarded.
+    offsets = np.where(
+        np.isnat(dates), 0, dates.astype("datetime64[D]").astype(np.int64) - _CALENDAR_START
+    )
+    if ((offsets >= 0) & (offsets < len(_CALENDAR_YEARS))).all():
+        return _CALENDAR_YEARS[offsets], _CALENDAR_DAYS[offsets]
+    return _civil_from_days(offsets + _CALENDAR_START)
+
+
+def age_at_date(date_of_birth, reference_date, banding: AgeBanding = None):
+    """
+    Calculate age in completed years at a reference date, optionally placed into bands
+
+    Ages are worked out with whole-column date arithmetic. A person's age goes up on the
+    anniversary of their date of birth, so someone born on 29 February is a year older
+    on 1 March in years that are not leap years. When a banding is given the ages are
+    banded directly, with no intermediate age column.
+
+    Parameters
+    ----------
+    date_of_birth : pd.Series, np.ndarray or list
+        Dates of birth, as datetime64 values or strings pandas can parse. Missing dates
+        are allowed.
+    reference_date : pd.Series, np.ndarray, list, str or datetime
+        Dates to calculate age at, either one for each date of birth or a single date.
+    banding : AgeBanding, default = None
+        If given, the banding to place ages into.
+
+    Returns
+    -------
+    out : pd.Series, pd.arrays.IntegerArray or pd.Categorical
+        Ages as nullable integers, missing where either date is missing, or the ordered
+        age bands if a banding is given. A Series, with the same index, is returned when
+        date_of_birth is a Series.
+
+    Examples
+    --------
+    >>> list(age_at_date(["2000-02-29", "2000-03-01", None], "2019-03-01"))
+    [19, 19, <NA>]
+    >>> list(age_at_date(["2000-02-29", "2000-03-01"], "2019-02-28"))
+    [18, 18]
+    >>> age_at_date(["1950-06-01", None], "2020-01-01", banding=AgeBanding([0, 16, 65])).tolist()
+    ['65 and over', nan]
+    """
+
+    if banding is not None and not isinstance(banding, AgeBanding):
+        raise ValueError("Please input an AgeBanding for banding.")
+
+    births = _to_datetime64(date_of_birth)
+    references = _to_datetime64(reference_date)
+    if np.ndim(references) and len(references) != len(births):
+        raise ValueError("Please input one reference date for each date of birth.")
+    missing = np.isnat(births) | np.isnat(references)
+
+    birth_years, birth_days = _year_and_day(births)
+    reference_years, reference_days = _year_and_day(references)
+    ages = reference_years - birth_years - (reference_days < birth_days)
+    ages = np.where(missing, 0, ages)
+
+    if banding is not None:
+        return banding._band_values(ages, missing, date_of_birth)
+    ages = pd.arrays.IntegerArray(ages, missing)
+    if isinstance(date_of_birth, pd.Series):
+        return pd.Series(ages, index=date_of_birth.index, name=date_of_birth.name)
+    return ages
@@ -1,5 +1,13 @@
 import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Generator
+
 import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from codonPython._char_codes import char_codes, code_table
 
 
 def nhsNumberValidator(number: int) -> bool:
@@ -46,6 +54,268 @@ def nhsNumberValidator(number: int) -> bool:
         return False
 
 
+def _weighted_sums(weights: tuple) -> np.ndarray:
+    """Weighted digit sums of every 3 digit block 000-999 for the given digit weights."""
+
+    blocks = np.arange(1000)
+    return (
+        weights[0] * (blocks // 100) + weights[1] * (blocks // 10 % 10) + weights[2] * (blocks % 10)
+    )
+
+
+# Lookup tables of weighted sums for the three 3 digit blocks of a 9 digit stem.
+_BLOCK_WEIGHTS = [_weighted_sums(weights) for weights in ((10, 9, 8), (7, 6, 5), (4, 3, 2))]
+
+
+def _check_digits(stems: np.ndarray) -> np.ndarray:
+    """
+    Modulus 11 check digits for an array of 9 digit stems. A result of 10 means no
+    valid NHS number can be formed from that stem.
+    """
+
+    # Splitting into blocks of 3 digits needs 2 divisions rather than one per digit.
+    high, rest = np.divmod(stems, 1000000)
+    middle, low = np.divmod(rest, 1000)
+    total = _BLOCK_WEIGHTS[0][high] + _BLOCK_WEIGHTS[1][middle] + _BLOCK_WEIGHTS[2][low]
+    return (11 - total % 11) % 11
+
+
+def _to_int64(numbers) -> tuple:
+    """
+    Coerce a column of numbers to an int64 array, along with a mask of entries which
+    cannot be NHS numbers because they are missing or not whole numbers.
+    """
+
+    values = numbers.to_numpy() if isinstance(numbers, pd.Series) else np.asarray(numbers)
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64, copy=False), np.zeros(len(values), dtype=bool)
+    # Floats, nullable integers and objects go via float64, which is exact for 10 digits.
+    values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+    bad = ~np.isfinite(values) | (values != np.floor(values))
+    return np.where(bad, 0, values).astype(np.int64), bad
+
+
+def _validate_int64(values: np.ndarray) -> np.ndarray:
+    """Modulus 11 checks on an int64 array of candidate NHS Numbers."""
+
+    valid = (values >= 1000000000) & (values <= 9999999999)
+    # Out of range values are zeroed so they index the lookup tables safely.
+    stems, last_digits = np.divmod(np.where(valid, values, 0), 10)
+    # A check digit of 10 never matches the final digit, so those numbers fail here too.
+    valid &= _check_digits(stems) == last_digits
+    return valid
+
+
+def _split(length: int, parts: int) -> list:
+    """Split range(length) into contiguous (start, stop) pairs of near equal size."""
+
+    bounds = np.linspace(0, length, parts + 1).astype(np.int64)
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _validate_shared(values_name: str, valid_name: str, length: int, start: int, stop: int):
+    """Process pool task validating a slice of a shared memory array in place."""
+
+    values_memory = shared_memory.SharedMemory(name=values_name)
+    valid_memory = shared_memory.SharedMemory(name=valid_name)
+    values = np.ndarray(length, dtype=np.int64, buffer=values_memory.buf)
+    valid = np.ndarray(length, dtype=bool, buffer=valid_memory.buf)
+    valid[start:stop] = _validate_int64(values[start:stop])
+    # Views on the shared buffers must be released before they can be closed.
+    del values, valid
+    values_memory.close()
+    valid_memory.close()
+
+
+def _check_workers(workers: int):
+    """Raise a ValueError unless `workers` is a positive integer."""
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("Please input a positive integer number of workers.")
+
+
+def nhsNumberArrayValidator(numbers, workers: int = 1):
+    """
+    Validate a whole column of NHS Numbers according to modulus 11 checks as recorded in
+    the data dictionary.
+
+    This is the vectorised counterpart of `nhsNumberValidator`. The digits are extracted
+    and weighted with whole-array integer arithmetic, so no Python function is called per
+    row. Rather than raising, entries that are missing, not whole numbers or not 10 digits
+    long are reported as invalid.
+
+    With more than one worker the numbers are placed in shared memory and validated in
+    slices by a process pool, rather than being pickled to each process.
+
+    Parameters
+    ----------
+    numbers : np.ndarray, pd.Series or pyarrow.Array
+        Integer NHS Numbers to validate.
+    workers : int, default : 1
+        Number of processes to validate with.
+
+    Returns
+    ----------
+    np.ndarray or pd.Series
+        Boolean mask of which numbers pass modulus 11 checks. A Series is returned, with
+        the same index, when a Series is given.
+
+    Examples
+    ---------
+    >>> nhsNumberArrayValidator(np.array([8429141456, 8429141457, 123]))
+    array([ True, False, False])
+    >>> nhsNumberArrayValidator(pd.Series([9598980006, None], dtype="Int64")).tolist()
+    [True, False]
+    """
+
+    _check_workers(workers)
+    values, bad = _to_int64(numbers)
+    if workers == 1:
+        valid = _validate_int64(values) & ~bad
+    else:
+        values_memory = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        valid_memory = shared_memory.SharedMemory(create=True, size=max(len(values), 1))
+        try:
+            # Entries already known to be bad are zeroed, which fails the range check.
+            np.ndarray(len(values), dtype=np.int64, buffer=values_memory.buf)[:] = np.where(
+                bad, 0, values
+            )
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                tasks = [
+                    executor.submit(
+                        _validate_shared, values_memory.name, valid_memory.name, len(values), start, stop
+                    )
+                    for start, stop in _split(len(values), workers)
+                ]
+                for task in tasks:
+                    task.result()
+            valid = np.ndarray(len(values), dtype=bool, buffer=valid_memory.buf).copy()
+        finally:
+            for memory in (values_memory, valid_memory):
+                memory.close()
+                memory.unlink()
+    if isinstance(numbers, pd.Series):
+        return pd.Series(valid, index=numbers.index, name=numbers.name)
+    return valid
+
+
+# Reason codes reported by `nhsNumberStringValidator`, in order of precedence.
+_STRING_REASONS = ["valid", "missing", "non-digit", "wrong length", "bad check digit"]
+# Characters ignored when normalising formatted NHS numbers: padding, tab, newline,
+# carriage return, space, dash and non-breaking space.
+_SEPARATORS = code_table([0, 9, 10, 13, 32, 45, 160])
+# Longest string parsed, generous for formatted numbers. Longer strings such as stray
+# free text are cut to one character more, so every row of a block is narrow.
+_MAX_STRING_LENGTH = 64
+
+
+def _parse_digit_strings(values: np.ndarray) -> tuple:
+    """
+    Parse an object array of strings or bytes, ignoring separators and leading zeros.
+
+    Returns the parsed int64 values, a mask of entries containing any character that is
+    not a digit or separator, and the number of significant digits in each entry.
+    Strings longer than `_MAX_STRING_LENGTH` are not parsed, and have a length of -1.
+    """
+
+    # One row of character codes per string position, one character past the longest.
+    codes = char_codes(values, _MAX_STRING_LENGTH + 1)
+    too_long = codes[-1] != 0
+
+    parsed = np.zeros(len(values), dtype=np.int64)
+    shifted = np.empty(len(values), dtype=np.int64)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    started = np.zeros(len(values), dtype=bool)
+    non_digit = np.zeros(len(values), dtype=bool)
+    for position in codes:
+        digit_values = position - np.uint8(48)
+        is_digit = digit_values < 10
+        non_digit |= ~is_digit & ~_SEPARATORS[position]
+        # Digits count once the first non-zero digit has been seen, so leading zeros drop
+        # out. Strings too long to fit in int64 wrap around, but fail on length anyway.
+        started |= is_digit & (digit_values != 0)
+        lengths += is_digit & started
+        np.multiply(parsed, 10, out=shifted)
+        shifted += digit_values
+        np.copyto(parsed, shifted, where=is_digit)
+    non_digit &= ~too_long
+    lengths[too_long] = -1
+    return parsed, non_digit, lengths
+
+
+def nhsNumberStringValidator(numbers: pd.Series, block_size: int = 250000) -> pd.DataFrame:
+    """
+    Normalise and validate a column of formatted NHS Number strings.
+
+    Spaces, dashes, stray whitespace and leading zeros are ignored, so "842 914 1456",
+    "842-914-1456" and " 08429141456" are all read as 8429141456. Strings are processed
+    as arrays of character codes in blocks of rows, without any per-row Python calls.
+    Strings longer than 64 characters are reported as the wrong length.
+
+    Parameters
+    ----------
+    numbers : pd.Series
+        Column of str or bytes NHS Numbers. Missing values are allowed.
+    block_size : int, default : 250000
+        Number of rows processed at once, bounding the memory used for character codes.
+
+    Returns
+    ----------
+    pd.DataFrame
+        DataFrame with the same index as `numbers` containing:
+            "NHS_Number" : Cleaned number as a nullable Int64, missing unless 10 digits
+            "Valid"      : Whether the number passes modulus 11 checks
+            "Reason"     : Categorical of "valid", "missing", "non-digit",
+                           "wrong length" or "bad check digit"
+
+    Examples
+    ---------
+    >>> nhsNumberStringValidator(
+    ...     pd.Series(["842 914 1456", "842-914-1457", "84291", "842X141456", None])
+    ... )
+       NHS_Number  Valid           Reason
+    0  8429141456   True            valid
+    1  8429141457  False  bad check digit
+    2        <NA>  False     wrong length
+    3        <NA>  False        non-digit
+    4        <NA>  False          missing
+    """
+
+    if not isinstance(numbers, pd.Series):
+        raise ValueError("Please input a pandas Series of NHS Numbers to validate.")
+    if not isinstance(block_size, int) or block_size < 1:
+        raise ValueError("Please input a positive integer block_size.")
+
+    values = numbers.to_numpy(dtype=object)
+    parsed = np.zeros(len(values), dtype=np.int64)
+    non_digit = np.zeros(len(values), dtype=bool)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for start in range(0, len(values), block_size):
+        block = slice(start, start + block_size)
+        parsed[block], non_digit[block], lengths[block] = _parse_digit_strings(values[block])
+
+    # Missing values are converted to strings such as "nan" and "None", so they can only
+    # be among the rows with non-digits.
+    missing = np.zeros(len(values), dtype=bool)
+    missing[non_digit] = pd.isna(values[non_digit])
+    non_digit &= ~missing
+    wrong_length = ~missing & ~non_digit & (lengths != 10)
+    cleaned = ~missing & ~non_digit & ~wrong_length
+    valid = nhsNumberArrayValidator(parsed) & cleaned
+    # Each row takes the first reason that applies to it.
+    reasons = np.select(
+        [valid, missing, non_digit, wrong_length], [0, 1, 2, 3], default=4
+    ).astype(np.int8)
+    return pd.DataFrame(
+        {
+            "NHS_Number": pd.arrays.IntegerArray(parsed, ~cleaned),
+            "Valid": valid,
+            "Reason": pd.Categorical.from_codes(reasons, _STRING_REASONS),
+        },
+        index=numbers.index,
+    )
+
+
 def nhsNumberGenerator(to_generate: int, random_state: int = None) -> list:
     """
     Generates up to 1M random NHS numbers compliant with modulus 11 checks as recorded
@@ -86,3 +356,296 @@ def nhsNumberGenerator(to_generate: int, random_state: int = None) -> list:
         if nhsNumberValidator(number):
             generated.append(number)
     return generated
+
+
+def _fill_generated(generated: np.ndarray, rng: np.random.Generator):
+    """Fill an int64 array with random valid NHS Numbers drawn from `rng`."""
+
+    filled = 0
+    while filled < len(generated):
+        remaining = len(generated) - filled
+        # Oversample so that a single draw almost always suffices.
+        stems = rng.integers(100000000, 999999999, size=remaining * 12 // 10 + 16, endpoint=True)
+        check_digits = _check_digits(stems)
+        keep = check_digits != 10
+        numbers = (stems[keep] * 10 + check_digits[keep])[:remaining]
+        generated[filled:filled + len(numbers)] = numbers
+        filled += len(numbers)
+
+
+def _generate_shared(
+    name: str, length: int, start: int, stop: int, seed: np.random.SeedSequence
+):
+    """Process pool task generating NHS Numbers into a slice of a shared memory array."""
+
+    memory = shared_memory.SharedMemory(name=name)
+    _fill_generated(
+        np.ndarray(length, dtype=np.int64, buffer=memory.buf)[start:stop],
+        np.random.default_rng(seed),
+    )
+    memory.close()
+
+
+def nhsNumberArrayGenerator(
+    to_generate: int, random_state: int = None, workers: int = 1
+) -> np.ndarray:
+    """
+    Generates random NHS numbers compliant with modulus 11 checks as recorded in the data
+    dictonary, with no limit on how many can be requested.
+
+    Random 9 digit stems are drawn in bulk and the check digit of each is calculated
+    arithmetically, discarding the roughly one in eleven stems whose check digit would be
+    10. Numbers may repeat.
+    https://www.datadictionary.nhs.uk/data_dictionary/attributes/n/nhs/nhs_number_de.asp?shownav=1
+
+    With more than one worker, each process fills its own slice of a shared memory array
+    from an independent random stream spawned from `random_state`. Results are then
+    reproducible for a given seed and number of workers.
+
+    Parameters
+    ----------
+    to_generate : int
+        number of NHS numbers to generate
+    random_state : int, default : None
+        Optional seed for random number generation, for testing and reproducibility.
+    workers : int, default : 1
+        Number of processes to generate with.
+
+    Returns
+    ----------
+    generated : np.ndarray
+        int64 array of randomly generated NHS numbers
+
+    Examples
+    ---------
+    >>> numbers = nhsNumberArrayGenerator(5, random_state=42)
+    >>> len(numbers), nhsNumberArrayValidator(numbers).all()
+    (5, True)
+    """
+
+    if not isinstance(to_generate, int):
+        raise ValueError("Please input a positive integer to generate numbers.")
+    if to_generate < 0:
+        raise ValueError("Please input a postitive integer to generate numbers.")
+
+    _check_workers(workers)
+
+    if workers == 1:
+        generated = np.empty(to_generate, dtype=np.int64)
+        _fill_generated(generated, np.random.default_rng(random_state))
+        return generated
+
+    memory = shared_memory.SharedMemory(create=True, size=max(to_generate * 8, 1))
+    try:
+        # Each worker gets its own child seed, so streams are independent but reproducible.
+        seeds = np.random.SeedSequence(random_state).spawn(workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tasks = [
+                executor.submit(_generate_shared, memory.name, to_generate, start, stop, seed)
+                for (start, stop), seed in zip(_split(to_generate, workers), seeds)
+            ]
+            for task in tasks:
+                task.result()
+        generated = np.ndarray(to_generate, dtype=np.int64, buffer=memory.buf).copy()
+    finally:
+        memory.close()
+        memory.unlink()
+    return generated
+
+
+def _valid_stem_count() -> int:
+    """Number of 9 digit stems, not starting with 0, which form a valid NHS number."""
+
+    # Count the block sums by remainder mod 11, then combine the three blocks.
+    counts = np.ones(1, dtype=np.int64)
+    for weights, blocks in zip(_BLOCK_WEIGHTS, (slice(100, 1000), slice(0, 1000), slice(0, 1000))):
+        block_counts = np.bincount(weights[blocks] % 11, minlength=11)
+        counts = np.convolve(counts, block_counts)
+    counts = np.bincount(np.arange(len(counts)) % 11, weights=counts)
+    # A remainder of 1 gives a check digit of 10, which is never valid.
+    return int(counts.sum() - counts[1])
+
+
+# Stem indices are permuted within 2^30, the smallest power of two above 900M stems.
+_HALF_BITS = 15
+_HALF_MASK = (1 << _HALF_BITS) - 1
+_STEM_SPACE = 900000000
+
+
+def _feistel(indices: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Keyed bijection of [0, 2^30) applied to an array of indices."""
+
+    left, right = indices >> _HALF_BITS, indices & _HALF_MASK
+    for key in keys:
+        mixed = (right * np.uint64(0x9E3779B1) + key) & np.uint64(0xFFFFFFFF)
+        mixed ^= mixed >> np.uint64(13)
+        left, right = right, left ^ (mixed & np.uint64(_HALF_MASK))
+    return (left << np.uint64(_HALF_BITS)) | right
+
+
+def _permute_stems(indices: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Keyed bijection of [0, 900M) onto the 9 digit stems 100000000-999999999."""
+
+    permuted = _feistel(indices.astype(np.uint64), keys)
+    # Cycle walk anything landing outside the stem space until it lands inside it.
+    outside = permuted >= _STEM_SPACE
+    while outside.any():
+        permuted[outside] = _feistel(permuted[outside], keys)
+        outside = permuted >= _STEM_SPACE
+    return permuted.astype(np.int64) + 100000000
+
+
+def nhsNumberUniqueGenerator(
+    to_generate: int, random_state: int = None, batch_size: int = 1000000
+) -> Generator[np.ndarray, None, None]:
+    """
+    Generates distinct random NHS numbers compliant with modulus 11 checks, in batches.
+
+    Numbers are produced by walking a seeded permutation of every 9 digit stem and
+    appending the check digit, skipping stems whose check digit would be 10. No number is
+    ever repeated and no record of previous numbers is kept, so memory use depends only on
+    `batch_size`. This makes it suitable for writing very large fixtures straight to disk.
+
+    Parameters
+    ----------
+    to_generate : int
+        number of NHS numbers to generate, up to the roughly 818 million valid numbers
+    random_state : int, default : None
+        Optional seed for random number generation, for testing and reproducibility.
+    batch_size : int, default : 1000000
+        Number of NHS numbers in each batch. The final batch may be smaller.
+
+    Yields
+    ----------
+    batch : np.ndarray
+        int64 array of distinct randomly generated NHS numbers
+
+    Examples
+    ---------
+    >>> batches = list(nhsNumberUniqueGenerator(5, random_state=42, batch_size=2))
+    >>> [len(batch) for batch in batches]
+    [2, 2, 1]
+    >>> len(set(np.concatenate(batches)))
+    5
+    """
+
+    if not isinstance(to_generate, int) or not isinstance(batch_size, int):
+        raise ValueError("Please input positive integers to generate numbers.")
+    if to_generate < 0 or batch_size < 1:
+        raise ValueError("Please input postitive integers to generate numbers.")
+    if to_generate > _valid_stem_count():
+        raise ValueError(f"Only {_valid_stem_count()} distinct NHS numbers exist.")
+
+    keys = np.random.default_rng(random_state).integers(
+        0, 1 << 32, size=4, dtype=np.uint64
+    )
+    position = 0
+    while to_generate > 0:
+        wanted = min(batch_size, to_generate)
+        batch = np.empty(wanted, dtype=np.int64)
+        filled = 0
+        while filled < wanted:
+            needed = wanted - filled
+            indices = np.arange(position, min(position + needed * 12 // 10 + 16, _STEM_SPACE))
+            stems = _permute_stems(indices, keys)
+            check_digits = _check_digits(stems)
+            keep = check_digits != 10
+            # Only consume as many indices as are needed, so none are skipped.
+            used = min(len(indices), np.searchsorted(np.cumsum(keep), needed) + 1)
+            numbers = stems[:used][keep[:used]] * 10 + check_digits[:used][keep[:used]]
+            batch[filled:filled + len(numbers)] = numbers
+            filled += len(numbers)
+            position += used
+        to_generate -= wanted
+        yield batch
+
+
+def _read_chunks(path: str, column: str, chunksize: int, all_columns: bool):
+    """Read a CSV or Parquet file in chunks of rows, as DataFrames."""
+
+    if path.lower().endswith((".parquet", ".pq")):
+        parquet_file = pq.ParquetFile(path)
+        if column not in parquet_file.schema_arrow.names:
+            raise KeyError(f"Column {column} is not in {path}.")
+        columns = None if all_columns else [column]
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        if column not in pd.read_csv(path, nrows=0).columns:
+            raise KeyError(f"Column {column} is not in {path}.")
+        # Reading as strings keeps formatting such as spaces, which is handled later.
+        yield from pd.read_csv(
+            path,
+            usecols=None if all_columns else [column],
+            dtype={column: str},
+            chunksize=chunksize,
+        )
+
+
+def nhsNumberFileValidator(
+    path: str, column: str, chunksize: int = 1000000, failures_path: str = None
+) -> dict:
+    """
+    Validate a column of NHS Numbers in a CSV or Parquet file, one chunk at a time.
+
+    The file is never loaded whole, so files larger than memory can be validated. Numeric
+    columns are validated with `nhsNumberArrayValidator` and anything else with
+    `nhsNumberStringValidator`. Parquet is recognised by a .parquet or .pq extension,
+    other files are read as CSV.
+
+    Parameters
+    ----------
+    path : str
+        Path to the CSV or Parquet file.
+    column : str
+        Name of the column holding NHS Numbers.
+    chunksize : int, default : 1000000
+        Number of rows read at once.
+    failures_path : str, default : None
+        If given, rows failing validation are written to this CSV file, with their row
+        offset in the original file as the "Row" column.
+
+    Returns
+    ----------
+    dict
+        Dictionary containing:
+            "total"        : Number of rows checked
+            "valid"        : Number of valid NHS Numbers
+            "invalid"      : Number of invalid NHS Numbers
+            "invalid_rows" : int64 array of the row offsets of invalid NHS Numbers
+
+    Examples
+    ---------
+    >>> nhsNumberFileValidator("extract.csv", "NHS_Number") #doctest: +SKIP
+    {'total': 3, 'valid': 2, 'invalid': 1, 'invalid_rows': array([1])}
+    """
+
+    if not isinstance(path, str) or not isinstance(column, str):
+        raise ValueError("Please input strings for the path and column name.")
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError("Please input a positive integer chunksize.")
+
+    total = 0
+    invalid_rows = []
+    for chunk in _read_chunks(path, column, chunksize, failures_path is not None):
+        numbers = chunk[column]
+        # Integer columns with nulls come back from Parquet as floats, so any numeric
+        # column goes to the array validator, which handles NaN.
+        if pd.api.types.is_numeric_dtype(numbers.dtype):
+            valid = nhsNumberArrayValidator(numbers).to_numpy()
+        else:
+            valid = nhsNumberStringValidator(numbers)["Valid"].to_numpy()
+        failures = np.flatnonzero(~valid)
+        if failures_path is not None:
+            failed = chunk.iloc[failures].set_index(pd.Index(failures + total, name="Row"))
+            failed.to_csv(failures_path, mode="w" if total == 0 else "a", header=total == 0)
+        invalid_rows.append(failures + total)
+        total += len(chunk)
+
+    invalid_rows = np.concatenate(invalid_rows) if invalid_rows else np.array([], dtype=np.int64)
+    return {
+        "total": total,
+        "valid": total - len(invalid_rows),
+        "invalid": len(invalid_rows),
+        "invalid_rows": invalid_rows,
+    }
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+
+
 def central_suppression_method(valuein: int, rc: str = "5", upper: int = 5000000000) -> str:
     """
     Suppresses and rounds values using the central suppression method.
@@ -45,3 +49,275 @@ def central_suppression_method(valuein: int, rc: str = "5", upper: int = 5000000
     else:
         raise ValueError("The input: {} is greater than: {}.".format(valuein, upper))
     return valueout
+
+
+def central_suppression_array(values, rc: str = "5", upper: int = 5000000000, numeric: bool = False):
+    """
+    Suppresses and rounds a whole column of values using the central suppression method.
+
+    This applies the same rules as `central_suppression_method` with whole-array integer
+    arithmetic. Rounding to the nearest 5 is done exactly as (value + 2) // 5 * 5, without
+    going through floats.
+
+    Parameters
+    ----------
+    values : np.ndarray, pd.Series or list
+        Integer metric values
+    rc : str
+        Replacement character if value needs suppressing
+    upper : int
+        Upper limit for suppression of numbers (5 billion)
+    numeric : bool, default = False
+        Set to true to return the rounded values as integers, along with a mask of which
+        values are suppressed, rather than as strings.
+
+    Returns
+    -------
+    out : pd.Categorical or pd.Series
+        Suppressed values as strings, held as a Categorical. A Series, with the same
+        index, is returned when a Series is given.
+    out, suppressed : tuple of np.ndarray
+        If numeric, the rounded int64 values, with suppressed values set to 0, and a
+        boolean mask of the suppressed values.
+
+    Examples
+    --------
+    >>> list(central_suppression_array([3, 24, 0]))
+    ['5', '25', '0']
+    >>> central_suppression_array([3, 24, 0], numeric=True)
+    (array([ 0, 25,  0]), array([ True, False, False]))
+    """
+    base = 5
+
+    array = values.to_numpy() if isinstance(values, pd.Series) else np.asarray(values)
+    # An empty column holds no values which are not integers, whatever its dtype.
+    if array.dtype.kind not in "iu" and array.size > 0:
+        if pd.api.types.infer_dtype(array, skipna=False) != "integer":
+            raise ValueError("The input contains values which are not integers.")
+        array = array.astype(np.int64)
+    array = array.astype(np.int64, copy=False)
+
+    if (array < 0).any():
+        raise ValueError("The input: {} is less than 0.".format(array[array < 0][0]))
+    if (array > upper).any():
+        raise ValueError("The input: {} is greater than: {}.".format(array[array > upper][0], upper))
+
+    suppressed = (array >= 1) & (array <= 7)
+    rounded = np.where(suppressed, 0, (array + base // 2) // base * base)
+    if numeric:
+        return rounded, suppressed
+
+    out = _label_suppressed(rounded, suppressed, rc)
+    if isinstance(values, pd.Series):
+        return pd.Series(out, index=values.index, name=values.name)
+    return out
+
+
+def _label_suppressed(rounded: np.ndarray, suppressed: np.ndarray, rc: str) -> pd.Categorical:
+    """
+    Categorical of rounded values as strings, with `rc` in place of suppressed values.
+    """
+
+    # Factorise the rounded values, marking suppressed ones with -1, then label each
+    # distinct value once rather than formatting a string for every row.
+    codes, uniques = pd.factorize(np.where(suppressed, -1, rounded))
+    labels = [rc if unique == -1 else str(unique) for unique in uniques]
+    label_codes, categories = pd.factorize(pd.Index(labels, dtype=object))
+    return pd.Categorical.from_codes(label_codes[codes], categories=categories)
+
+
+def _relation_edges(
+    geography: pd.Series, parent: pd.Series, measure: pd.Series, total_measure: str
+) -> tuple:
+    """
+    Membership of cells in the additive relations of a long format table.
+
+    Each relation is a total cell and the cells that sum to it: the children of a
+    geography for the same measure and, when `total_measure` is given, the other measures
+    for the same geography. Relations are numbered by the row of their total cell, offset
+    by the number of rows for measure totals. Returns (cell, relation, is_total) arrays
+    with one entry for each time a cell belongs to a relation.
+    """
+
+    rows = len(geography)
+    geography_codes, geographies = pd.factorize(geography)
+    measure_codes, measures = pd.factorize(measure)
+    cell_keys = geography_codes.astype(np.int64) * len(measures) + measure_codes
+    key_count = len(geographies) * len(measures)
+    if key_count <= 4 * rows:
+        # Dense lookup from key to row, when every geography has most measures.
+        if np.bincount(cell_keys, minlength=key_count).max(initial=0) > 1:
+            raise ValueError("Each geography and measure should appear only once.")
+        key_rows = np.full(key_count + 1, -1)
+        key_rows[cell_keys] = np.arange(rows)
+        lookup = key_rows.take
+    else:
+        cell_index = pd.Index(cell_keys)
+        if not cell_index.is_unique:
+            raise ValueError("Each geography and measure should appear only once.")
+        lookup = cell_index.get_indexer
+
+    def rows_of(geography_codes, measure_codes):
+        # Row of the cell for each geography and measure, or -1 where there is none.
+        found = (geography_codes >= 0) & (measure_codes >= 0)
+        keys = np.where(found, geography_codes.astype(np.int64) * len(measures) + measure_codes, key_count)
+        return np.where(found, lookup(keys), -1)
+
+    cells, relations = [], []
+    # Children sum to their parent geography, for each measure.
+    parent_codes = geographies.get_indexer(parent)
+    totals = rows_of(parent_codes, measure_codes)
+    cells.append(np.flatnonzero(totals >= 0))
+    relations.append(totals[totals >= 0])
+    # Other measures sum to the total measure, for each geography.
+    if total_measure is not None:
+        total_code = measures.get_indexer([total_measure])[0]
+        if total_code < 0:
+            raise KeyError("The total measure does not appear in the measure column.")
+        totals = rows_of(geography_codes, np.full(rows, total_code))
+        has_total = (totals >= 0) & (measure_codes != total_code)
+        cells.append(np.flatnonzero(has_total))
+        relations.append(totals[has_total] + rows)
+
+    cells = np.concatenate(cells)
+    relations = np.concatenate(relations)
+    # Each total cell is also a member of its own relation.
+    total_relations = np.flatnonzero(np.bincount(relations, minlength=2 * rows))
+    return (
+        np.concatenate([cells, total_relations % rows]),
+        np.concatenate([relations, total_relations]),
+        np.concatenate([np.zeros(len(cells), dtype=bool), np.ones(len(total_relations), dtype=bool)]),
+    )
+
+
+def _ragged_take(values: np.ndarray, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Concatenation of values[start:stop] for each start and stop, without a loop."""
+
+    lengths = stops - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return values[np.arange(lengths.sum()) + offsets]
+
+
+def secondary_suppression(
+    data: pd.DataFrame,
+    geography_col: str = "Org_Code",
+    parent_col: str = "Parent_Code",
+    measure_col: str = "Measure",
+    value_col: str = "Value_Unsuppressed",
+    total_measure: str = None,
+    rc: str = "*",
+    output_col: str = "Value",
+) -> pd.DataFrame:
+    """
+    Applies primary and secondary suppression to a long format publication table.
+
+    Primary suppression follows the central suppression method: 1-7 are suppressed, 0
+    stays 0 and everything else is rounded to the nearest 5. Secondary suppression then
+    hides further cells so that no suppressed value can be recovered by subtraction from
+    a total. A total is either the parent geography's cell for the same measure or, if
+    `total_measure` is given, the same geography's total measure. Whenever exactly one
+    cell in a total and the cells summing to it is suppressed, the smallest other
+    non-zero cell is suppressed too, preferring cells over totals. This is repeated
+    until no suppressed value can be recovered.
+
+    Each pass works on all totals at once using grouped array operations, so run time
+    grows almost linearly with the size of the table.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Table with one row per geography and measure.
+    geography_col : str, default = "Org_Code"
+        Column name for the geography code.
+    parent_col : str, default = "Parent_Code"
+        Column name for the code of the geography each geography sums into. Missing for
+        the top of the hierarchy.
+    measure_col : str, default = "Measure"
+        Column name for measure.
+    value_col : str, default = "Value_Unsuppressed"
+        Column name for the unsuppressed integer values.
+    total_measure : str, default = None
+        Measure which is the sum of all other measures for a geography, if any.
+    rc : str, default = "*"
+        Replacement character for suppressed values.
+    output_col : str, default = "Value"
+        Column name for the suppressed and rounded values.
+
+    Returns
+    -------
+    pd.DataFrame
+        Copy of `data` with `output_col` added, holding the published values as strings,
+        and a "Suppressed" column flagging every suppressed cell.
+
+    Examples
+    --------
+    >>> secondary_suppression(
+    ...   pd.DataFrame({
+    ...     "Org_Code" : ["ENG", "R1", "R2", "R3"],
+    ...     "Parent_Code" : [None, "ENG", "ENG", "ENG"],
+    ...     "Measure" : ["m1", "m1", "m1", "m1"],
+    ...     "Value_Unsuppressed" : [63, 3, 20, 40],
+    ...   })
+    ... )
+      Org_Code Parent_Code Measure  Value_Unsuppressed Value  Suppressed
+    0      ENG        None      m1                  63    65       False
+    1       R1         ENG      m1                   3     *        True
+    2       R2         ENG      m1                  20     *        True
+    3       R3         ENG      m1                  40    40       False
+    """
+
+    for column in (geography_col, parent_col, measure_col, value_col, output_col):
+        if not isinstance(column, str):
+            raise ValueError("Please input strings for column names.")
+    for column in (geography_col, parent_col, measure_col, value_col):
+        if column not in data.columns:
+            raise KeyError("Check column names correspond to the DataFrame.")
+
+    values = data[value_col].to_numpy()
+    rounded, suppressed = central_suppression_array(values, numeric=True)
+    cells, relations, is_total = _relation_edges(
+        data[geography_col], data[parent_col], data[measure_col], total_measure
+    )
+    # Members of each relation, ranked by cells before totals, non-zero values first,
+    # then size. Values are at most 5,000,000,000 so the rank fits in 36 bits, and when
+    # relation numbers fit in the rest a single sort of packed keys is much faster than
+    # a lexsort.
+    rank = (
+        (is_total.astype(np.int64) << 35)
+        | ((values[cells] == 0).astype(np.int64) << 34)
+        | values[cells].astype(np.int64)
+    )
+    if len(data) < 2 ** 26:
+        rank = np.argsort((relations.astype(np.int64) << 36) | rank)
+    else:
+        rank = np.lexsort((rank, relations))
+    ranked_cells = cells[rank]
+    relation_sizes = np.bincount(relations, minlength=2 * len(data))
+    relation_starts = np.concatenate([[0], np.cumsum(relation_sizes)])
+    # Relations each cell belongs to.
+    by_cell = np.argsort(cells, kind="stable")
+    cell_relations = relations[by_cell]
+    cell_starts = np.concatenate([[0], np.cumsum(np.bincount(cells, minlength=len(data)))])
+
+    # Relations with exactly one suppressed member would reveal its value. After the first
+    # pass only relations containing newly suppressed cells need to be looked at again.
+    counts = np.bincount(relations, weights=suppressed[cells], minlength=2 * len(data))
+    exposed = np.flatnonzero(counts == 1)
+    while len(exposed):
+        members = _ragged_take(ranked_cells, relation_starts[exposed], relation_starts[exposed + 1])
+        owners = np.repeat(exposed, relation_sizes[exposed])
+        # Members are in rank order, so the first unsuppressed member of each exposed
+        # relation is the one to suppress.
+        unsuppressed = ~suppressed[members]
+        owners, members = owners[unsuppressed], members[unsuppressed]
+        chosen = np.unique(members[np.diff(owners, prepend=-1) != 0])
+        suppressed[chosen] = True
+
+        touched = _ragged_take(cell_relations, cell_starts[chosen], cell_starts[chosen + 1])
+        np.add.at(counts, touched, 1)
+        touched = np.unique(touched)
+        exposed = touched[counts[touched] == 1]
+
+    return data.assign(
+        **{output_col: _label_suppressed(rounded, suppressed, rc), "Suppressed": suppressed}
+    )
@@ -1,5 +1,6 @@
 from codonPython import age_bands
 import numpy as np
+import pandas as pd
 import math
 import pytest
 
@@ -114,3 +115,197 @@ def test_age_band_10_years_edgeCases(age, expected):
 )
 def test_age_band_10_years_BAU_floats(age, expected):
     assert expected == age_bands.age_band_10_years(age)
+
+
+@pytest.mark.parametrize(
+    "banding, scalar_banding",
+    [
+        (age_bands.age_band_5_years_array, age_bands.age_band_5_years),
+        (age_bands.age_band_10_years_array, age_bands.age_band_10_years),
+    ],
+)
+def test_age_band_arrays_matchScalar(banding, scalar_banding):
+    ages = list(range(150)) + [0.1, 12.3, 89.9, 90.1]
+    expected = [scalar_banding(age) for age in ages]
+    assert expected == banding(ages).tolist()
+    assert expected == banding(pd.Series(ages, dtype=float)).tolist()
+    assert banding([None]).isna().all()
+
+
+@pytest.mark.parametrize(
+    "ages",
+    [
+        np.array([0, 45, 90]),
+        pd.Series([0, 45, 90]),
+        pd.Series([0, 45, 90], dtype="Int64"),
+    ],
+)
+def test_age_band_5_years_array_categorical(ages):
+    banded = age_bands.age_band_5_years_array(ages)
+    categories = banded.cat.categories if isinstance(banded, pd.Series) else banded.categories
+    assert list(categories[[0, -1]]) == ["0-4", "90 and over"]
+    assert ["0-4", "45-49", "90 and over"] == list(banded)
+
+
+def test_age_band_10_years_array_keepsIndex():
+    ages = pd.Series([3, pd.NA], index=["a", "b"], dtype="Int64")
+    banded = age_bands.age_band_10_years_array(ages)
+    assert banded.cat.ordered
+    assert ["a", "b"] == list(banded.index)
+    assert "0-9" == banded["a"]
+    assert pd.isna(banded["b"])
+
+
+@pytest.mark.parametrize(
+    "banding, band",
+    [
+        (age_bands.age_band_5_years_array, "60-64"),
+        (age_bands.age_band_10_years_array, "60-69"),
+    ],
+)
+def test_age_band_arrays_missingNotCompared(banding, band):
+    banded = banding(pd.Series([70, None, 20]))
+    assert [True, False, False] == list(banded >= band)
+    assert [False, False, True] == list(banded < band)
+    assert banding([70]).max() == banded.max()
+
+
+@pytest.mark.parametrize("ages", [["age"], pd.Series(["3"])])
+def test_age_band_arrays_typeErrors(ages):
+    with pytest.raises(TypeError):
+        age_bands.age_band_5_years_array(ages)
+    with pytest.raises(TypeError):
+        age_bands.age_band_10_years_array(ages)
+
+
+@pytest.mark.parametrize("ages", [[math.inf], [-3], [343], [-0.1], [1, 150]])
+def test_age_band_arrays_valueErrors(ages):
+    with pytest.raises(ValueError):
+        age_bands.age_band_5_years_array(ages)
+    with pytest.raises(ValueError):
+        age_bands.age_band_10_years_array(ages)
+
+
+@pytest.mark.parametrize(
+    "edges, labels, ages, expected",
+    [
+        ([0, 16, 65], None, [0, 15, 16, 64, 65, 149], ["0-15"] * 2 + ["16-64"] * 2 + ["65 and over"] * 2),
+        ([0, 18], ["Child", "Adult"], [17.9, 0.5, 18], ["Child", "Child", "Adult"]),
+        (list(range(19)), None, [5, 17, 18, 90], ["5", "17", "18 and over", "18 and over"]),
+    ],
+)
+def test_AgeBanding_BAU(edges, labels, ages, expected):
+    banding = age_bands.AgeBanding(edges, labels)
+    assert expected == banding.band(ages).tolist()
+    assert expected == banding.band(pd.Series(ages, dtype=float)).tolist()
+    assert expected == [banding.band(age) for age in ages]
+
+
+def test_AgeBanding_dataFrameColumn():
+    data = pd.DataFrame({"Age": [3, 40, 70]}, index=[10, 20, 30])
+    data["Age_Band"] = age_bands.AgeBanding([0, 16, 65]).band(data["Age"])
+    assert ["0-15", "16-64", "65 and over"] == list(data["Age_Band"])
+    assert data["Age_Band"].cat.ordered
+
+
+@pytest.mark.parametrize(
+    "edges, labels",
+    [
+        ([0, 16, 65], None),
+        ([0, 18], ["Child", "Adult"]),
+    ],
+)
+def test_AgeBanding_missingNotCompared(edges, labels):
+    banding = age_bands.AgeBanding(edges, labels)
+    banded = banding.band([None, 90, 0])
+    assert "Age not known" not in banded.categories
+    assert [False, True, False] == list(banded > banded.categories[0])
+    assert banded.categories[-1] == banded.max()
+    assert "Age not known" == banding.band(None)
+
+
+def test_AgeBanding_cached():
+    first = age_bands.AgeBanding([0, 16, 65])
+    second = age_bands.AgeBanding((0, 16, 65))
+    assert first._table is second._table
+    assert first._table is not age_bands.AgeBanding([0, 16, 65], ["a", "b", "c"])._table
+
+
+@pytest.mark.parametrize(
+    "edges, labels",
+    [
+        ([], None),
+        ([5, 10], None),  # Doesn't start at 0
+        ([0, 10, 10], None),  # Not increasing
+        ([0, 150], None),  # Beyond maximum age
+        ([0, 10.5], None),  # Not whole numbers
+        ([0, 10], ["a"]),  # Wrong number of labels
+    ],
+)
+def test_AgeBanding_valueErrors(edges, labels):
+    with pytest.raises(ValueError):
+        age_bands.AgeBanding(edges, labels)
+
+
+@pytest.mark.parametrize("age", [np.inf, -1, 150, [3, -0.1]])
+def test_AgeBanding_band_valueErrors(age):
+    with pytest.raises(ValueError):
+        age_bands.AgeBanding([0, 16, 65]).band(age)
+
+
+def test_AgeBanding_band_typeErrors():
+    with pytest.raises(TypeError):
+        age_bands.AgeBanding([0, 16, 65]).band("age")
+
+
+@pytest.mark.parametrize(
+    "date_of_birth, reference_date, expected",
+    [
+        (["2000-02-29"], "2019-02-28", [18]),  # Leap day birthday in a non-leap year
+        (["2000-02-29"], "2019-03-01", [19]),
+        (["2000-02-29"], "2020-02-29", [20]),
+        (["1990-06-15"], "2020-06-14", [29]),  # Day before birthday
+        (["1990-06-15"], "2020-06-15", [30]),  # Birthday
+        (["1990-06-15", None], "2020-06-15", [30, pd.NA]),
+        (["1990-06-15"], None, [pd.NA]),
+        (["1700-03-01", "2250-01-01"], "2260-01-01", [559, 10]),  # Outside 1800-2199
+        (["1990-06-15", "1990-06-15"], ["2000-06-14", "2000-06-15"], [9, 10]),
+    ],
+)
+def test_age_at_date_BAU(date_of_birth, reference_date, expected):
+    dates = np.array(date_of_birth, dtype="datetime64[D]")
+    if isinstance(reference_date, list):
+        reference_date = np.array(reference_date, dtype="datetime64[D]")
+    assert expected == list(age_bands.age_at_date(dates, reference_date))
+
+
+def test_age_at_date_matchesRowwise():
+    rng = np.random.default_rng(42)
+    births = pd.Timestamp("1900-01-01") + pd.to_timedelta(rng.integers(0, 40000, 5000), unit="D")
+    references = pd.Timestamp("1950-01-01") + pd.to_timedelta(rng.integers(0, 30000, 5000), unit="D")
+    expected = [
+        reference.year - birth.year - ((reference.month, reference.day) < (birth.month, birth.day))
+        for birth, reference in zip(births, references)
+    ]
+    assert expected == list(age_bands.age_at_date(births, references))
+
+
+def test_age_at_date_banding():
+    births = pd.Series(pd.to_datetime(["2010-01-01", None, "1950-01-01"]), index=[3, 2, 1])
+    banded = age_bands.age_at_date(births, "2020-01-01", banding=age_bands.AgeBanding([0, 16, 65]))
+    assert ["0-15", "65 and over"] == list(banded[[3, 1]])
+    assert pd.isna(banded[2])
+    assert [3, 2, 1] == list(banded.index)
+
+
+@pytest.mark.parametrize(
+    "date_of_birth, reference_date, banding",
+    [
+        (["2000-01-01"], "2020-01-01", [0, 16, 65]),  # Not an AgeBanding
+        (["2000-01-01", "2001-01-01"], ["2020-01-01"], None),  # Wrong number of dates
+        (["2030-01-01"], "2020-01-01", age_bands.AgeBanding([0, 16, 65])),  # Negative age
+    ],
+)
+def test_age_at_date_valueErrors(date_of_birth, reference_date, banding):
+    with pytest.raises(ValueError):
+        age_bands.age_at_date(date_of_birth, reference_date, banding=banding)
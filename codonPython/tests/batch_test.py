@@ -0,0 +1,69 @@
+from codonPython.validation.batch import run_batch
+from codonPython.validation.check_consistent_submissions import check_consistent_submissions
+from codonPython.validation.check_null import check_null
+from functools import partial
+import numpy as np
+import pandas as pd
+import pytest
+
+testdata = pd.DataFrame(
+    {
+        "Org_Level": ["National", "Local", "Local"],
+        "Measure": ["m1", "m1", "m1"],
+        "Value_Unsuppressed": [4, 4, 4],
+    }
+)
+
+checks = {
+    "null": partial(check_null, columns_to_be_checked=["Value_Unsuppressed"]),
+    "consistent_submissions": check_consistent_submissions,
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_recordsEachFile(tmp_path, workers):
+    paths = [str(tmp_path / name) for name in ["a.csv", "b.parquet", "c.csv", "d.txt"]]
+    testdata.to_csv(paths[0], index=False)
+    testdata.assign(Value_Unsuppressed=[4, 4, np.nan]).to_parquet(paths[1])
+    testdata.drop(columns="Measure").to_csv(paths[2], index=False)
+    open(paths[3], "w").close()
+
+    summary = run_batch(paths + [testdata], checks, workers=workers)
+    assert list(summary.columns) == ["submission", "check", "result", "error", "seconds", "submission_seconds"]
+    assert list(summary["submission"]) == [paths[0]] * 2 + [paths[1]] * 2 + [paths[2]] * 2 + [paths[3]] * 2 + ["4"] * 2
+    assert list(summary["check"]) == ["null", "consistent_submissions"] * 5
+    assert list(summary["result"]) == [0, True, 1, True, 0, None, None, None, 0, True]
+    assert summary["error"].isna().tolist() == [True, True, True, True, True, False, False, False, True, True]
+    assert summary.loc[5, "error"].startswith("KeyError")
+    assert summary.loc[6, "error"].startswith("ValueError")
+    assert (summary.loc[summary["error"].isna(), "seconds"] >= 0).all()
+    assert (summary["submission_seconds"] >= summary["seconds"].fillna(0)).all()
+
+
+def test_run_batch_namesAndReader():
+    frames = {"first": testdata, "second": testdata.assign(Value_Unsuppressed=[4, 4, 5])}
+    summary = run_batch(list(frames), checks, workers=1, reader=frames.get)
+    assert list(summary["submission"]) == ["first", "first", "second", "second"]
+    assert list(summary["result"]) == [0, True, 0, False]
+
+
+def test_run_batch_unpicklableCheck():
+    summary = run_batch({"a": testdata}, {"rows": lambda data: len(data)}, workers=2)
+    assert summary.loc[0, "result"] is None
+    assert summary.loc[0, "error"] is not None
+    assert run_batch({"a": testdata}, {"rows": lambda data: len(data)}, workers=1).loc[0, "result"] == 3
+
+
+@pytest.mark.parametrize(
+    "submissions, checks, workers",
+    [
+        (testdata, checks, 1),
+        ([testdata], [check_null], 1),
+        ([testdata], {"null": "check_null"}, 1),
+        ([testdata], checks, 0),
+        ([testdata], checks, 1.5),
+    ],
+)
+def test_run_batch_errors(submissions, checks, workers):
+    with pytest.raises(ValueError):
+        run_batch(submissions, checks, workers=workers)
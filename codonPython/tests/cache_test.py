@@ -0,0 +1,66 @@
+from codonPython.validation.cache import AggregateCache
+from codonPython.validation.suite import ValidationSuite
+import numpy as np
+import pandas as pd
+import pytest
+
+testdata = pd.DataFrame(
+    {
+        "Period": ["2020-01"] * 4 + ["2020-02"] * 4 + ["2020-03"] * 4,
+        "Org_Level": ["National", "Region", "Local", "Local"] * 3,
+        "Measure": ["m1", "m1", "m1", "m2"] * 3,
+        "Value_Unsuppressed": [9, 4, 5, 3, 8, 4, 4, 2, 9, 4, 5, 3],
+    }
+)
+
+
+def sorted_aggregates(suite):
+    return suite.aggregates.sort_values(["Org_Level", "Measure"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "changes, recomputed",
+    [
+        ({}, 0),
+        ({11: 4}, 1),
+        ({0: 7, 7: 1}, 2),
+        ({3: 1, 7: 1, 11: 1}, 2),
+    ],
+)
+def test_suite_recomputesChangedPartitions(tmp_path, changes, recomputed):
+    cache = AggregateCache(str(tmp_path / "aggregates.pkl"))
+    data = testdata.copy()
+    first = cache.suite(data, ["Period"])
+    # The first and last periods have the same rows, so are aggregated once.
+    assert cache.recomputed == 2
+    pd.testing.assert_frame_equal(sorted_aggregates(first), sorted_aggregates(ValidationSuite(data)))
+
+    for row, value in changes.items():
+        data.loc[row, "Value_Unsuppressed"] = value
+    second = AggregateCache(cache.path).suite(data, ["Period"])
+    assert AggregateCache(cache.path).suite(data, ["Period"]).run() == second.run()
+    pd.testing.assert_frame_equal(sorted_aggregates(second), sorted_aggregates(ValidationSuite(data)))
+    assert second.run() == ValidationSuite(data).run()
+
+
+def test_suite_ignoresRowOrder(tmp_path):
+    cache = AggregateCache(str(tmp_path / "aggregates.pkl"))
+    data = testdata.astype({"Value_Unsuppressed": float})
+    cache.suite(data, ["Period", "Org_Level"])
+    data.loc[[5, 6], "Value_Unsuppressed"] = np.nan
+    suite = cache.suite(data.sample(frac=1, random_state=1), ["Period", "Org_Level"])
+    assert cache.recomputed == 2
+    pd.testing.assert_frame_equal(sorted_aggregates(suite), sorted_aggregates(ValidationSuite(data)))
+
+
+@pytest.mark.parametrize(
+    "partition_cols, exception",
+    [
+        ("Period", ValueError),
+        ([1], ValueError),
+        (["Month"], KeyError),
+    ],
+)
+def test_suite_errors(tmp_path, partition_cols, exception):
+    with pytest.raises(exception):
+        AggregateCache(str(tmp_path / "aggregates.pkl")).suite(testdata, partition_cols)
@@ -113,3 +113,71 @@ def test_each_org_levels_valueErrors_measure_col(
 def test_each_geography_col_keyError(data, geography_col, measure_col, measures_set):
     with pytest.raises(KeyError):
         check_consistent_measures(data, geography_col, measure_col, measures_set)
+
+
+@pytest.mark.parametrize(
+    "measures, measures_set, expected",
+    [
+        (["m1", "m2", "m2", "m1", "m2", "m1"], set(), True),
+        (["m1", "m2", "m1", "m1", "m2", "m3"], set(), False),
+        (["m1", "m1", "m1", "m1", "m1", "m1"], set({"m1", "m2"}), False),
+    ],
+)
+def test_each_org_levels_chunks(measures, measures_set, expected):
+    data = pd.DataFrame(
+        {
+            "Org_Level": ["National", "Region", "National", "Region", "Region", "National"],
+            "Measure": measures,
+        }
+    )
+    chunks = (data.iloc[start:start + 2] for start in range(0, len(data), 2))
+    assert expected == check_consistent_measures(chunks, measures_set=measures_set)
+
+
+def test_each_org_levels_chunks_missingLocation():
+    chunks = iter(
+        [
+            pd.DataFrame({"Org_Level": ["National", "Region"], "Measure": ["m1", "m1"]}),
+            pd.DataFrame({"Org_Level": ["National", "Region"], "Measure": ["m2", np.nan]}),
+        ]
+    )
+    with pytest.raises(ValueError, match=r"\(3, 'Measure'\)"):
+        check_consistent_measures(chunks)
+
+
+def test_each_org_levels_diagnostics():
+    data = pd.DataFrame(
+        {"Org_Level": ["National", "National", "Region", "Local"], "Measure": ["m1", "m2", "m1", "m2"]}
+    )
+    result = check_consistent_measures(data, diagnostics=True)
+    assert not result
+    assert ["Local", "Region"] == list(result.offending["Org_Level"])
+    assert [["m2"], ["m1"]] == list(result.offending["observed"])
+    assert [["m1", "m2"], ["m1", "m2"]] == list(result.offending["expected"])
+
+    result = check_consistent_measures(data.iloc[:2], diagnostics=True)
+    assert result and result.offending.empty
+
+
+def test_each_org_levels_onlyKeyColumnsChecked():
+    data = pd.DataFrame(
+        {"Org_Level": ["National", "Region"] * 50, "Measure": ["m1"] * 100, "Other": np.nan}
+    )
+    assert check_consistent_measures(data)
+
+    data.loc[::2, "Measure"] = np.nan
+    with pytest.raises(ValueError, match=r"^50 missing values .* first at locations \[\(0, 'Measure'\), \(2,") as error:
+        check_consistent_measures(data)
+    assert str(error.value).count("Measure") == 10
+
+
+@pytest.mark.parametrize(
+    "measures, measures_set, expected",
+    [(["m1", "m2", "m2", "m1"], set(), True), (["m1", "m2", "m1", "m1"], set(), False), (["m1"] * 4, {"m2"}, False)],
+)
+def test_each_org_levels_categorical(measures, measures_set, expected):
+    data = pd.DataFrame({"Org_Level": ["National", "National", "Region", "Region"], "Measure": measures})
+    # Unused categories are not measures.
+    categorical = data.astype({"Org_Level": "category", "Measure": pd.CategoricalDtype(["m1", "m2", "m3"])})
+    assert expected == check_consistent_measures(categorical, measures_set=measures_set)
+    assert expected == check_consistent_measures(data, measures_set=measures_set)
@@ -130,3 +130,54 @@ def test_each_consistent_submissions_colError(
         check_consistent_submissions(
             data, national_geog_level, geography_col, submissions_col, measure_col
         )
+
+
+@pytest.mark.parametrize(
+    "submissions, expected",
+    [([9, 4, 2, 5, 4, 2], True), ([9, 4, 2, 5, 3, 2], False), ([9, 4, np.nan, 5, 4, np.nan], False)],
+)
+def test_each_consistent_submissions_chunks(submissions, expected):
+    data = pd.DataFrame(
+        {
+            "Org_Level": ["National", "Region", "Region", "National", "Local", "Local"],
+            "Measure": ["m1", "m1", "m2", "m2", "m1", "m2"],
+            "Value_Unsuppressed": submissions,
+        }
+    )
+    chunks = (data.iloc[start:start + 2] for start in range(0, len(data), 2))
+    assert expected == check_consistent_submissions(chunks)
+    assert expected == check_consistent_submissions(data)
+
+
+def test_each_consistent_submissions_diagnostics():
+    data = pd.DataFrame(
+        {
+            "Org_Level": ["National", "Region", "Local", "Region", "Local", "Region"],
+            "Measure": ["m1", "m1", "m1", "m2", "m2", "m3"],
+            "Value_Unsuppressed": [9, 4, 4, 5, 3, np.nan],
+        }
+    )
+    result = check_consistent_submissions(data, diagnostics=True)
+    assert not result
+    assert ["m2", "m3"] == list(result.offending["Measure"])
+    assert [2, 0] == list(result.offending["observed"])
+    assert [1, 1] == list(result.offending["expected"])
+
+    result = check_consistent_submissions(data.iloc[:3], diagnostics=True)
+    assert result and result.offending.empty
+
+
+@pytest.mark.parametrize(
+    "submissions, expected", [([9, 4, 4, 2, 2], True), ([9, 4, 5, 2, 2], False), ([9, 4, 4, np.nan, np.nan], False)]
+)
+def test_each_consistent_submissions_categorical(submissions, expected):
+    data = pd.DataFrame(
+        {
+            "Org_Level": ["National", "Region", "Local", "Region", "Local"],
+            "Measure": ["m1", "m1", "m1", "m2", "m2"],
+            "Value_Unsuppressed": submissions,
+        }
+    )
+    categorical = data.astype({"Org_Level": "category", "Measure": "category"})
+    assert expected == check_consistent_submissions(categorical)
+    assert expected == check_consistent_submissions(data)
@@ -106,3 +106,42 @@ def test_KeyErrors(df, breakdown_col, measure_col, value_col, nat_val):
             value_col=value_col,
             nat_val=nat_val,
         )
+
+
+def test_diagnostics():
+    data = pd.DataFrame(
+        {
+            "Breakdown": ["National", "CCG", "Provider", "CCG"],
+            "Measure": ["m1", "m1", "m1", "m2"],
+            "Value_Unsuppressed": [10, 12, 8, 5],
+        }
+    )
+    result = check_nat_val(data, diagnostics=True)
+    assert not result
+    assert [("m1", "Provider"), ("m2", "CCG")] == list(zip(result.offending["Measure"], result.offending["Breakdown"]))
+    assert [8, 5] == list(result.offending["observed"])
+    assert [10] == list(result.offending["expected"].dropna())
+
+    result = check_nat_val(data.iloc[:2], diagnostics=True)
+    assert result and result.offending.empty
+
+
+def test_categorical():
+    categorical = df.astype({"Breakdown": "category", "measure": "category"})
+    assert check_nat_val(categorical, measure_col="measure")
+    raised_national = categorical.assign(Value_Unsuppressed=df["Value_Unsuppressed"].where(df.index > 0, 100))
+    assert not check_nat_val(raised_national, measure_col="measure")
+
+
+@pytest.mark.parametrize("national_m1, expected", [(9, True), (19, False)])
+def test_chunks(tmp_path, national_m1, expected):
+    data = df.assign(Value_Unsuppressed=df["Value_Unsuppressed"].where(df.index > 0, national_m1))
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    assert expected == check_nat_val(pd.read_csv(path, chunksize=4), measure_col="measure")
+    chunks = (data.iloc[start:start + 4] for start in range(0, len(data), 4))
+    chunked = check_nat_val(chunks, measure_col="measure", diagnostics=True)
+    pd.testing.assert_frame_equal(
+        chunked.offending, check_nat_val(data, measure_col="measure", diagnostics=True).offending
+    )
+    assert check_nat_val(iter([]))
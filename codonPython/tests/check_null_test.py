@@ -1,6 +1,8 @@
-from codonPython.validation.check_null import check_null
+from codonPython.validation.check_null import check_null, null_profile
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 testdata = pd.DataFrame(
@@ -31,3 +33,120 @@ def test_ValueError(dataframe, columns_to_be_checked):
 def test_KeyError(dataframe, columns_to_be_checked):
     with pytest.raises(KeyError):
         check_null(dataframe, columns_to_be_checked)
+
+
+@pytest.mark.parametrize(
+    "dataframe, columns_to_be_checked, null_positions, expected",
+    [
+        (
+            testdata,
+            ["col1", "col2"],
+            0,
+            pd.DataFrame({"null_count": [0, 2], "null_fraction": [0.0, 0.2]}, index=["col1", "col2"]),
+        ),
+        (
+            testdata,
+            ["col2", "col1"],
+            1,
+            pd.DataFrame(
+                {"null_count": [2, 0], "null_fraction": [0.2, 0.0], "null_positions": [[5], []]},
+                index=["col2", "col1"],
+            ),
+        ),
+        (
+            testdata.assign(col3=[None, "a"] * 5),
+            ["col2", "col3"],
+            3,
+            pd.DataFrame(
+                {"null_count": [2, 5], "null_fraction": [0.2, 0.5], "null_positions": [[5, 6], [0, 2, 4]]},
+                index=["col2", "col3"],
+            ),
+        ),
+        (
+            testdata.iloc[:0],
+            ["col2"],
+            0,
+            pd.DataFrame({"null_count": [0], "null_fraction": [np.nan]}, index=["col2"]),
+        ),
+    ],
+)
+def test_null_profile_BAU(dataframe, columns_to_be_checked, null_positions, expected):
+    pd.testing.assert_frame_equal(
+        null_profile(dataframe, columns_to_be_checked, null_positions), expected
+    )
+
+
+@pytest.mark.parametrize(
+    "columns_to_be_checked, null_positions, error",
+    [("col1", 0, ValueError), (["col1"], -1, ValueError), (["col1"], 1.5, ValueError), (["col3"], 0, KeyError)],
+)
+def test_null_profile_errors(columns_to_be_checked, null_positions, error):
+    with pytest.raises(error):
+        null_profile(testdata, columns_to_be_checked, null_positions)
+
+
+@pytest.mark.parametrize(
+    "columns_to_be_checked, expected", [(["col1", "col2"], 2), (["col2", "col2"], 4), ([], 0)]
+)
+def test_arrowTable(columns_to_be_checked, expected):
+    assert check_null(pa.Table.from_pandas(testdata), columns_to_be_checked) == expected
+
+
+@pytest.mark.parametrize(
+    "write_statistics, reads",
+    [(True, []), (False, [["col2"], ["col2"], ["col2"], ["col2"]]), (["col1"], [["col2"]] * 4)],
+)
+def test_parquet_readsOnlyWithoutStatistics(tmp_path, monkeypatch, write_statistics, reads):
+    path = tmp_path / "testdata.parquet"
+    pq.write_table(
+        pa.Table.from_pandas(testdata), path, row_group_size=3, write_statistics=write_statistics
+    )
+    read_row_group = pq.ParquetFile.read_row_group
+    read = []
+
+    def recording_read_row_group(self, i, columns=None, **kwargs):
+        read.append(columns)
+        return read_row_group(self, i, columns=columns, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", recording_read_row_group)
+    assert check_null(path, ["col2"]) == 2
+    assert check_null(str(path), ["col1"]) == 0
+    assert read == reads + ([["col1"]] * 4 if write_statistics is False else [])
+
+
+def test_parquet_structColumn(tmp_path):
+    path = tmp_path / "nested.parquet"
+    pq.write_table(pa.table({"col1": [{"a": 1}, None, {"a": None}], "col2": [1, None, 3]}), path)
+    assert check_null(path, ["col1", "col2"]) == 2
+
+
+@pytest.mark.parametrize("columns_to_be_checked, error", [(["wrong_column"], KeyError), ("col1", ValueError)])
+def test_parquetAndArrow_errors(tmp_path, columns_to_be_checked, error):
+    path = tmp_path / "testdata.parquet"
+    pq.write_table(pa.Table.from_pandas(testdata), path)
+    with pytest.raises(error):
+        check_null(path, columns_to_be_checked)
+    with pytest.raises(error):
+        check_null(pa.Table.from_pandas(testdata), columns_to_be_checked)
+
+
+def test_chunks(tmp_path):
+    path = tmp_path / "testdata.csv"
+    testdata.to_csv(path, index=False)
+    assert check_null(pd.read_csv(path, chunksize=3), ["col1", "col2"]) == 2
+    assert check_null(iter([]), ["col1"]) == 0
+    with pytest.raises(KeyError):
+        check_null(pd.read_csv(path, chunksize=3), ["wrong_column"])
+
+
+def test_null_profile_chunks():
+    data = testdata.assign(col3=[None, "a", "b", None, None, "c", "d", "e", None, "f"])
+    chunks = (data.iloc[start:start + 4] for start in range(0, len(data), 4))
+    pd.testing.assert_frame_equal(
+        null_profile(chunks, ["col2", "col3"], null_positions=3),
+        null_profile(data, ["col2", "col3"], null_positions=3),
+    )
+    pd.testing.assert_frame_equal(
+        null_profile(iter([]), ["col2"]),
+        pd.DataFrame({"null_count": [0], "null_fraction": [np.nan]}, index=["col2"]),
+    )
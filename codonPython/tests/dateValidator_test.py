@@ -1,4 +1,6 @@
 from codonPython.validation import dateValidator
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -28,3 +30,55 @@ def test_validDate_positives(date_string, expected):
 )
 def test_validDate_negatives(date_string, expected):
     assert expected == dateValidator.validDate(date_string)
+
+
+@pytest.mark.parametrize(
+    "date_strings",
+    [
+        ["01/01/1900", "29/02/1992", "31/05/2020", "29/02/2040", "31/12/2049"],
+        ["31/12/1899", "29/02/1990", "31/04/2020", "29/02/2041", "01/01/2050"],
+        ["1-1-1990", "01.1.1990", "1/01/1990", "01/01-1990", "00/01/1990", "01/13/1990"],
+        ["29/02/04", "29/02/00", "29/2/1600", "29/02/1700", "29/02/2400", "29.02.0004"],
+        ["30/02/2000", "31/06/2000", "30/06/2000", "31/07/2000", "31/7/2000", "29/02/2000"],
+        ["19/11/19ab", "01/01/2045", "01/01/1990\n", "01/01/1990\n\n", " 01/01/1990", ""],
+    ],
+)
+def test_validDates_matchesValidDate(date_strings):
+    expected = [dateValidator.validDate(date_string) for date_string in date_strings]
+    assert expected == list(dateValidator.validDates(pd.Series(date_strings)))
+
+
+def test_validDates_missingAndNonStrings():
+    dates = pd.Series(["01/01/1990", None, np.nan, 1990, b"01/01/1990"], index=list("abcde"))
+    result = dateValidator.validDates(dates)
+    assert list("abcde") == list(result.index)
+    assert [True, False, False, False, False] == list(result)
+
+
+@pytest.mark.parametrize(
+    "date_strings, kwargs, expected",
+    [
+        (
+            ["01/01/1900", "29/02/2000", "31-12-2049", "1.2.1990", "29/02/1900", "31/04/2020"],
+            {},
+            ["1900-01-01", "2000-02-29", "2049-12-31", "1990-02-01", None, None],
+        ),
+        (["31/12/1899", "01/01/2050", "01/01/90", "01/01/19ab", "01/01-1990"], {}, [None] * 5),
+        (
+            ["31/12/1899", "29/02/1800", "01/01/2050"],
+            {"min_year": 1800, "max_year": 2100},
+            ["1899-12-31", None, "2050-01-01"],
+        ),
+        (["01/01/2020", None, np.nan, 2020], {"min_year": 2020, "max_year": 2020}, ["2020-01-01", None, None, None]),
+    ],
+)
+def test_parseDates(date_strings, kwargs, expected):
+    parsed, valid = dateValidator.parseDates(pd.Series(date_strings), **kwargs)
+    assert list(pd.to_datetime(pd.Series(expected, dtype=object))) == list(parsed)
+    assert [date is not None for date in expected] == list(valid)
+
+
+@pytest.mark.parametrize("kwargs", [{"min_year": 1600}, {"max_year": 2300}, {"min_year": 2000, "max_year": 1999}])
+def test_parseDates_valueErrors(kwargs):
+    with pytest.raises(ValueError):
+        dateValidator.parseDates(pd.Series(["01/01/2000"]), **kwargs)
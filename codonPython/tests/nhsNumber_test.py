@@ -1,4 +1,16 @@
-from codonPython.nhsNumber import nhsNumberGenerator, nhsNumberValidator
+from codonPython.nhsNumber import (
+    nhsNumberArrayGenerator,
+    nhsNumberArrayValidator,
+    nhsNumberFileValidator,
+    nhsNumberGenerator,
+    nhsNumberStringValidator,
+    nhsNumberUniqueGenerator,
+    nhsNumberValidator,
+)
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import random
 
@@ -28,3 +40,212 @@ def test_nhsNumberValidator_BAU(to_validate, expected):
 def test_nhsNumberValidator_valueErrors(to_validate):
     with pytest.raises(ValueError):
         nhsNumberValidator(to_validate)
+
+
+@pytest.mark.parametrize(
+    "to_validate, expected",
+    [
+        (np.array([9598980006, 9598980007, 8429141456]), [True, False, True]),
+        (np.array([1000001, -1, 99999999999]), [False, False, False]),
+        (pd.Series([9598980006, np.nan, 4.2]), [True, False, False]),
+        (pd.Series([8429141456, None], dtype="Int64"), [True, False]),
+        (pa.chunked_array([[9598980006, None, 9598980007]]), [True, False, False]),
+    ],
+)
+def test_nhsNumberArrayValidator_BAU(to_validate, expected):
+    assert expected == list(nhsNumberArrayValidator(to_validate))
+
+
+def test_nhsNumberArrayValidator_matchesScalar():
+    numbers = np.random.RandomState(42).randint(1000000000, 9999999999, size=10000)
+    expected = [nhsNumberValidator(int(number)) for number in numbers]
+    assert expected == nhsNumberArrayValidator(numbers).tolist()
+
+
+def test_nhsNumberArrayValidator_keepsIndex():
+    numbers = pd.Series([9598980006, 9598980007], index=["a", "b"])
+    result = nhsNumberArrayValidator(numbers)
+    assert list(result.index) == ["a", "b"]
+
+
+@pytest.mark.parametrize("to_generate", [0, 1, 1000, 1000001])
+def test_nhsNumberArrayGenerator_BAU(to_generate):
+    generated = nhsNumberArrayGenerator(to_generate, random_state=42)
+    assert len(generated) == to_generate
+    assert nhsNumberArrayValidator(generated).all()
+
+
+def test_nhsNumberArrayGenerator_reproducible():
+    first = nhsNumberArrayGenerator(1000, random_state=1)
+    assert (first == nhsNumberArrayGenerator(1000, random_state=1)).all()
+    assert not (first == nhsNumberArrayGenerator(1000, random_state=2)).all()
+
+
+@pytest.mark.parametrize("to_generate", [4.2, -1])
+def test_nhsNumberArrayGenerator_valueErrors(to_generate):
+    with pytest.raises(ValueError):
+        nhsNumberArrayGenerator(to_generate)
+
+
+@pytest.mark.parametrize(
+    "to_generate, batch_size, expected_sizes",
+    [(0, 10, []), (25, 10, [10, 10, 5]), (100000, 100000, [100000])],
+)
+def test_nhsNumberUniqueGenerator_BAU(to_generate, batch_size, expected_sizes):
+    batches = list(
+        nhsNumberUniqueGenerator(to_generate, random_state=42, batch_size=batch_size)
+    )
+    assert expected_sizes == [len(batch) for batch in batches]
+    generated = np.concatenate(batches) if batches else np.array([], dtype=np.int64)
+    assert len(np.unique(generated)) == to_generate
+    assert nhsNumberArrayValidator(generated).all()
+
+
+def test_nhsNumberUniqueGenerator_batchSizeIndependent():
+    small = np.concatenate(list(nhsNumberUniqueGenerator(1000, 7, batch_size=33)))
+    large = np.concatenate(list(nhsNumberUniqueGenerator(1000, 7, batch_size=1000)))
+    assert (small == large).all()
+
+
+@pytest.mark.parametrize(
+    "to_generate, batch_size", [(4.2, 10), (-1, 10), (10, 0), (10 ** 9, 10)]
+)
+def test_nhsNumberUniqueGenerator_valueErrors(to_generate, batch_size):
+    with pytest.raises(ValueError):
+        next(nhsNumberUniqueGenerator(to_generate, batch_size=batch_size))
+
+
+@pytest.mark.parametrize(
+    "to_validate, number, valid, reason",
+    [
+        ("8429141456", 8429141456, True, "valid"),
+        ("842 914 1456", 8429141456, True, "valid"),
+        ("842-914-1456", 8429141456, True, "valid"),
+        (" 08429141456\n", 8429141456, True, "valid"),
+        (b"9598980006", 9598980006, True, "valid"),
+        ("9598980007", 9598980007, False, "bad check digit"),
+        ("959898000", pd.NA, False, "wrong length"),
+        ("0959898000", pd.NA, False, "wrong length"),
+        ("95989800061", pd.NA, False, "wrong length"),
+        ("", pd.NA, False, "wrong length"),
+        ("9598980006" + " " * 54, 9598980006, True, "valid"),
+        ("9598980006" + " " * 55, pd.NA, False, "wrong length"),
+        ("9598980006" + "X" * 100000, pd.NA, False, "wrong length"),
+        ("9598980006.0", pd.NA, False, "non-digit"),
+        ("959898000X", pd.NA, False, "non-digit"),
+        (b"\xff", pd.NA, False, "non-digit"),
+        (None, pd.NA, False, "missing"),
+        (np.nan, pd.NA, False, "missing"),
+    ],
+)
+def test_nhsNumberStringValidator_BAU(to_validate, number, valid, reason):
+    result = nhsNumberStringValidator(pd.Series([to_validate], dtype=object))
+    assert result["NHS_Number"].iloc[0] is number or result["NHS_Number"].iloc[0] == number
+    assert valid == result["Valid"].iloc[0]
+    assert reason == result["Reason"].iloc[0]
+
+
+def test_nhsNumberStringValidator_blocks():
+    numbers = nhsNumberArrayGenerator(1000, random_state=42)
+    result = nhsNumberStringValidator(pd.Series(numbers.astype(str)), block_size=7)
+    assert result["Valid"].all()
+    assert (result["NHS_Number"].to_numpy() == numbers).all()
+
+
+@pytest.mark.parametrize(
+    "to_validate, block_size",
+    [(["9598980006"], 10), (pd.Series(["9598980006"]), 0)],
+)
+def test_nhsNumberStringValidator_valueErrors(to_validate, block_size):
+    with pytest.raises(ValueError):
+        nhsNumberStringValidator(to_validate, block_size=block_size)
+
+
+extract = pd.DataFrame(
+    {
+        "NHS_Number": ["842 914 1456", "8429141457", None, "9598980006", "95989"],
+        "Activity": [1, 2, 3, 4, 5],
+    }
+)
+
+
+@pytest.mark.parametrize("file_name", ["extract.csv", "extract.parquet"])
+@pytest.mark.parametrize("chunksize", [1, 2, 1000])
+def test_nhsNumberFileValidator_BAU(tmp_path, file_name, chunksize):
+    path = str(tmp_path / file_name)
+    if file_name.endswith(".csv"):
+        extract.to_csv(path, index=False)
+    else:
+        extract.to_parquet(path, index=False)
+    failures_path = str(tmp_path / "failures.csv")
+
+    result = nhsNumberFileValidator(
+        path, "NHS_Number", chunksize=chunksize, failures_path=failures_path
+    )
+    assert (result["total"], result["valid"], result["invalid"]) == (5, 2, 3)
+    assert [1, 2, 4] == list(result["invalid_rows"])
+    failures = pd.read_csv(failures_path)
+    assert [1, 2, 4] == list(failures["Row"])
+    assert [2, 3, 5] == list(failures["Activity"])
+
+
+def test_nhsNumberFileValidator_integers(tmp_path):
+    path = str(tmp_path / "extract.parquet")
+    pd.DataFrame({"NHS_Number": [8429141456, 8429141457]}).to_parquet(path)
+    result = nhsNumberFileValidator(path, "NHS_Number")
+    assert [1] == list(result["invalid_rows"])
+
+
+@pytest.mark.parametrize("chunksize", [1, 1000])
+def test_nhsNumberFileValidator_integersWithNulls(tmp_path, chunksize):
+    path = str(tmp_path / "extract.parquet")
+    pq.write_table(
+        pa.table({"NHS_Number": pa.array([8429141456, None, 9598980006], pa.int64())}), path
+    )
+    result = nhsNumberFileValidator(path, "NHS_Number", chunksize=chunksize)
+    assert (result["total"], result["valid"], result["invalid"]) == (3, 2, 1)
+    assert [1] == list(result["invalid_rows"])
+
+
+@pytest.mark.parametrize("file_name", ["extract.csv", "extract.parquet"])
+def test_nhsNumberFileValidator_keyErrors(tmp_path, file_name):
+    path = str(tmp_path / file_name)
+    if file_name.endswith(".csv"):
+        extract.to_csv(path, index=False)
+    else:
+        extract.to_parquet(path, index=False)
+    with pytest.raises(KeyError):
+        nhsNumberFileValidator(path, "Wrong_Column")
+
+
+@pytest.mark.parametrize("path, column, chunksize", [(1, "NHS_Number", 10), ("a.csv", "NHS_Number", 0)])
+def test_nhsNumberFileValidator_valueErrors(path, column, chunksize):
+    with pytest.raises(ValueError):
+        nhsNumberFileValidator(path, column, chunksize=chunksize)
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_nhsNumberArrayValidator_workers(workers):
+    numbers = pd.Series(
+        np.random.RandomState(42).randint(1000000000, 9999999999, size=10000)
+    )
+    numbers[5] = np.nan
+    expected = nhsNumberArrayValidator(numbers)
+    assert expected.equals(nhsNumberArrayValidator(numbers, workers=workers))
+
+
+@pytest.mark.parametrize("to_generate, workers", [(0, 2), (10001, 2), (10001, 3)])
+def test_nhsNumberArrayGenerator_workers(to_generate, workers):
+    generated = nhsNumberArrayGenerator(to_generate, random_state=42, workers=workers)
+    assert len(generated) == to_generate
+    assert nhsNumberArrayValidator(generated).all()
+    repeated = nhsNumberArrayGenerator(to_generate, random_state=42, workers=workers)
+    assert (generated == repeated).all()
+
+
+@pytest.mark.parametrize("workers", [0, 1.5])
+def test_workers_valueErrors(workers):
+    with pytest.raises(ValueError):
+        nhsNumberArrayValidator(np.array([9598980006]), workers=workers)
+    with pytest.raises(ValueError):
+        nhsNumberArrayGenerator(10, workers=workers)
@@ -0,0 +1,113 @@
+from codonPython.validation.check_consistent_measures import check_consistent_measures
+from codonPython.validation.check_consistent_submissions import check_consistent_submissions
+from codonPython.validation.check_nat_val import check_nat_val
+from codonPython.validation.suite import ValidationSuite
+import numpy as np
+import pandas as pd
+import pytest
+
+testdata = pd.DataFrame(
+    {
+        "Org_Level": ["National", "Region", "Region", "Local", "Local", "National", "Region", "Local"],
+        "Measure": ["m1", "m1", "m1", "m1", "m1", "m2", "m2", "m2"],
+        "Value_Unsuppressed": [9, 4, 5, 3, 6, 2, 2, 2],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        testdata,
+        testdata.assign(Value_Unsuppressed=[9, 4, 4, 4, 4, 2, 2, 2]),
+        testdata.assign(Value_Unsuppressed=[8, 4, 4, 4, 4, 2, 2, np.nan]),
+        testdata.assign(Value_Unsuppressed=[8, 4, 4, 4, 4, 2, np.nan, np.nan]),
+        testdata.iloc[1:],
+        testdata.iloc[:-1],
+    ],
+)
+def test_run_matchesFunctions(data):
+    assert ValidationSuite(data).run() == {
+        "consistent_measures": check_consistent_measures(data.drop(columns="Value_Unsuppressed")),
+        "consistent_submissions": check_consistent_submissions(data),
+        "nat_val": check_nat_val(data, breakdown_col="Org_Level"),
+    }
+
+
+def test_from_aggregates_combinesParts():
+    data = testdata.assign(Value_Unsuppressed=[8, 4, 4, 4, 4, 2, 2, np.nan])
+    aggregates = pd.concat([ValidationSuite(data.iloc[:3]).aggregates, ValidationSuite(data.iloc[3:]).aggregates])
+    suite = ValidationSuite.from_aggregates(aggregates)
+    pd.testing.assert_frame_equal(suite.aggregates, ValidationSuite(data).aggregates, check_dtype=False)
+    assert suite.run() == ValidationSuite(data).run()
+
+
+def test_register_and_run_subset(monkeypatch):
+    monkeypatch.setattr(ValidationSuite, "checks", dict(ValidationSuite.checks))
+
+    @ValidationSuite.register("few_rows")
+    def few_rows(suite):
+        return suite.aggregates["rows"].sum() < 5
+
+    suite = ValidationSuite(testdata)
+    assert suite.run(["few_rows", "nat_val"]) == {"few_rows": False, "nat_val": True}
+    assert "few_rows" in suite.run()
+    with pytest.raises(KeyError):
+        suite.run(["not_a_check"])
+
+
+def test_register_onSubclass():
+    class RowCountSuite(ValidationSuite):
+        pass
+
+    @RowCountSuite.register("few_rows")
+    def few_rows(suite):
+        return suite.aggregates["rows"].sum() < 5
+
+    assert "few_rows" not in ValidationSuite.checks
+    assert "few_rows" not in ValidationSuite(testdata).run()
+    assert RowCountSuite(testdata).run() == {**ValidationSuite(testdata).run(), "few_rows": False}
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"geography_col": "Geog"}, KeyError),
+        ({"value_col": 1}, ValueError),
+        ({"national_geog_level": None}, ValueError),
+        ({"measures_set": ["m1"]}, ValueError),
+    ],
+)
+def test_errors(kwargs, error):
+    with pytest.raises(error):
+        ValidationSuite(testdata, **kwargs)
+
+
+def test_consistent_measures_missingMeasure():
+    data = testdata.assign(Measure=["m1"] * 7 + [None])
+    suite = ValidationSuite(data)
+    assert suite.run(["nat_val"]) == {"nat_val": check_nat_val(data, breakdown_col="Org_Level")}
+    with pytest.raises(ValueError):
+        suite.run(["consistent_measures"])
+
+
+def test_run_diagnostics():
+    data = testdata.assign(Value_Unsuppressed=[12, 4, 5, 3, 6, 2, 2, 3]).iloc[:-1]
+    results = ValidationSuite(data).run(diagnostics=True)
+    assert {name: bool(result) for name, result in results.items()} == ValidationSuite(data).run()
+
+    measures = results["consistent_measures"].offending
+    assert ["Local"] == list(measures["Org_Level"])
+    assert [["m1"]] == list(measures["observed"])
+
+    submissions = results["consistent_submissions"].offending
+    assert ["m1"] == list(submissions["Measure"])
+    assert ["Measure", "min", "max"] == list(submissions.columns)
+    assert [(3, 6)] == list(zip(submissions["min"], submissions["max"]))
+
+    nat_val = check_nat_val(data, breakdown_col="Org_Level", diagnostics=True).offending
+    pd.testing.assert_frame_equal(
+        results["nat_val"].offending.sort_values(["Measure", "Org_Level"], ignore_index=True),
+        nat_val,
+        check_dtype=False,
+    )
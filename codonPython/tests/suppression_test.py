@@ -1,4 +1,6 @@
-from codonPython.suppression import central_suppression_method
+from codonPython.suppression import central_suppression_array, central_suppression_method, secondary_suppression
+import numpy as np
+import pandas as pd
 import pytest
 
 
@@ -14,3 +16,149 @@ def test_central_suppression_method_BAU(to_suppress, expected):
 def test_suppress_value_valueErrors(to_suppress):
     with pytest.raises(ValueError):
         central_suppression_method(to_suppress)
+
+
+@pytest.mark.parametrize(
+    "to_suppress",
+    [
+        np.arange(0, 10000),
+        pd.Series([0, 2, 5, 8, 16, 57, 10023]),
+        pd.Series([0, 2, 5, 8], dtype="Int64"),
+        [4999999997, 4999999998, 5000000000],
+    ],
+)
+def test_central_suppression_array_matchesScalar(to_suppress):
+    expected = [central_suppression_method(int(value)) for value in to_suppress]
+    assert expected == list(central_suppression_array(to_suppress))
+
+
+@pytest.mark.parametrize(
+    "to_suppress, rc, expected",
+    [([0, 3, 8], "*", ["0", "*", "10"]), ([0, 3, 8], "0", ["0", "0", "10"])],
+)
+def test_central_suppression_array_rc(to_suppress, rc, expected):
+    assert expected == list(central_suppression_array(to_suppress, rc=rc))
+
+
+def test_central_suppression_array_numeric():
+    rounded, suppressed = central_suppression_array([0, 1, 7, 8, 12, 13], numeric=True)
+    assert [0, 0, 0, 10, 10, 15] == list(rounded)
+    assert [False, True, True, False, False, False] == list(suppressed)
+
+
+def test_central_suppression_array_keepsIndex():
+    suppressed = central_suppression_array(pd.Series([3, 24], index=["a", "b"]))
+    assert ["a", "b"] == list(suppressed.index)
+    assert ["5", "25"] == list(suppressed)
+
+
+@pytest.mark.parametrize("to_suppress", [[], np.array([], dtype=float), pd.Series([], dtype=object)])
+def test_central_suppression_array_empty(to_suppress):
+    assert [] == list(central_suppression_array(to_suppress))
+    rounded, suppressed = central_suppression_array(to_suppress, numeric=True)
+    assert (0, 0) == (len(rounded), len(suppressed))
+
+
+@pytest.mark.parametrize(
+    "to_suppress",
+    [[-1, 3], [4.2], [1, None], pd.Series([1, None], dtype="Int64"), ["8"], [5000000001]],
+)
+def test_central_suppression_array_valueErrors(to_suppress):
+    with pytest.raises(ValueError):
+        central_suppression_array(to_suppress)
+
+
+def _table(org_codes, parent_codes, measures, values):
+    return pd.DataFrame(
+        {"Org_Code": org_codes, "Parent_Code": parent_codes, "Measure": measures, "Value_Unsuppressed": values}
+    )
+
+
+@pytest.mark.parametrize(
+    "table, total_measure, expected",
+    [
+        (
+            _table(["ENG", "R1", "R2", "R3"], [None, "ENG", "ENG", "ENG"], ["m1"] * 4, [63, 3, 20, 40]),
+            None,
+            ["65", "*", "*", "40"],
+        ),
+        (
+            # No suppression needed when nothing is primary suppressed.
+            _table(["ENG", "R1", "R2"], [None, "ENG", "ENG"], ["m1"] * 3, [30, 10, 20]),
+            None,
+            ["30", "10", "20"],
+        ),
+        (
+            # Zeros are kept when there is a non-zero cell to suppress instead.
+            _table(["ENG", "R1", "R2", "R3"], [None, "ENG", "ENG", "ENG"], ["m1"] * 4, [23, 3, 0, 20]),
+            None,
+            ["25", "*", "0", "*"],
+        ),
+        (
+            # With a single child the total is suppressed.
+            _table(["ENG", "R1"], [None, "ENG"], ["m1"] * 2, [3, 3]),
+            None,
+            ["*", "*"],
+        ),
+        (
+            # Cells with no totals only have primary suppression.
+            _table(list("ABCDEF"), [None] * 6, [f"m{i}" for i in range(6)], [3, 8, 0, 12, 1, 20]),
+            None,
+            ["*", "10", "0", "10", "*", "20"],
+        ),
+        (
+            # Suppression across measures then spreads down to the other region.
+            _table(
+                ["ENG", "ENG", "ENG", "R1", "R1", "R1", "R2", "R2", "R2"],
+                [None, None, None, "ENG", "ENG", "ENG", "ENG", "ENG", "ENG"],
+                ["a", "b", "Total"] * 3,
+                [40, 60, 100, 3, 30, 33, 37, 30, 67],
+            ),
+            "Total",
+            ["40", "60", "100", "*", "*", "35", "*", "*", "65"],
+        ),
+    ],
+)
+def test_secondary_suppression_BAU(table, total_measure, expected):
+    result = secondary_suppression(table, total_measure=total_measure)
+    assert expected == list(result["Value"])
+    assert [value == "*" for value in expected] == list(result["Suppressed"])
+
+
+def test_secondary_suppression_noValueRecoverable():
+    rng = np.random.default_rng(0)
+    org_codes = ["ENG"] + [f"R{i}" for i in range(5)] + [f"P{i}" for i in range(50)]
+    parent_codes = [None] + ["ENG"] * 5 + [f"R{i // 10}" for i in range(50)]
+    leaves = pd.DataFrame(rng.poisson(4, size=(50, 3)), columns=["a", "b", "c"])
+    regions = leaves.groupby(np.arange(50) // 10).sum()
+    wide = pd.concat([regions.sum().to_frame().T, regions, leaves], ignore_index=True)
+    wide["Total"] = wide.sum(axis=1)
+    wide["Org_Code"], wide["Parent_Code"] = org_codes, parent_codes
+    table = wide.melt(id_vars=["Org_Code", "Parent_Code"], var_name="Measure", value_name="Value_Unsuppressed")
+
+    suppressed = secondary_suppression(table, total_measure="Total").set_index(["Org_Code", "Measure"])["Suppressed"]
+    table = table.set_index(["Org_Code", "Measure"])
+    # Every total with its children, and every geography across its measures.
+    groups = [
+        [(org_code, measure) for org_code in [parent] + [o for o, p in zip(org_codes, parent_codes) if p == parent]]
+        for parent in org_codes[:6]
+        for measure in ["a", "b", "c", "Total"]
+    ] + [[(org_code, measure) for measure in ["a", "b", "c", "Total"]] for org_code in org_codes]
+    assert all(suppressed.loc[group].sum() != 1 for group in groups)
+    assert suppressed[table["Value_Unsuppressed"].between(1, 7)].all()
+
+
+@pytest.mark.parametrize(
+    "table, kwargs, error",
+    [
+        (_table(["ENG"], [None], ["m1"], [3]), {"measure_col": "Metric"}, KeyError),
+        (_table(["ENG"], [None], ["m1"], [3]), {"total_measure": "Total"}, KeyError),
+        (_table(["ENG"], [None], ["m1"], [3]), {"value_col": 1}, ValueError),
+        (_table(["ENG", "ENG"], [None, None], ["m1", "m1"], [3, 4]), {}, ValueError),
+        (_table(list("AABCDE"), [None] * 6, ["m1", "m1", "m2", "m3", "m4", "m5"], [3] * 6), {}, ValueError),
+        (_table(["ENG", "R1"], [None, "ENG"], ["m1", "m1"], [3, -4]), {}, ValueError),
+    ],
+)
+def test_secondary_suppression_errors(table, kwargs, error):
+    with pytest.raises(error):
+        secondary_suppression(table, **kwargs)
@@ -1,4 +1,4 @@
-from codonPython.validation.tolerance import check_tolerance
+from codonPython.validation.tolerance import check_tolerance, check_tolerance_grouped
 import numpy as np
 import pandas as pd
 import pandas.util.testing as pdt
@@ -108,6 +108,18 @@ def test_tolerance_checking_BAU(
     pdt.assert_frame_equal(expected, obtained)
 
 
+@pytest.mark.parametrize("poly_features", [[], [1], [0, 2, 1]])
+def test_tolerance_predict_all(poly_features):
+    obtained = check_tolerance(*testdata, to_exclude=2, poly_features=poly_features, predict_all=True)
+    if not poly_features:
+        assert obtained.empty
+        return
+    assert list(obtained.columns) == ["t", "yhat_u", "yobs", "yhat", "yhat_l", "polynomial"]
+    assert list(obtained["polynomial"]) == np.repeat(poly_features, len(testdata[0])).tolist()
+    assert list(obtained["t"]) == testdata[0].tolist() * len(poly_features)
+    assert (obtained["yhat_l"] <= obtained["yhat_u"]).all()
+
+
 @pytest.mark.parametrize(
     "t, y, to_exclude, poly_features, alpha",
     [
@@ -157,3 +169,88 @@ def test_AssertionErrors(t, y, to_exclude, poly_features, alpha):
         check_tolerance(
             t, y, to_exclude=to_exclude, poly_features=poly_features, alpha=alpha
         )
+
+
+@pytest.mark.parametrize(
+    "to_exclude, poly_features, parse_dates, predict_all",
+    [
+        (2, [1, 2], False, False),
+        (1, [3, 0], False, False),
+        (3, [4], False, False),
+        (2, [1, 2], True, False),
+        (2, [2], False, True),
+    ],
+)
+def test_grouped_matchesEachSeries(to_exclude, poly_features, parse_dates, predict_all):
+    t, y = testdata
+    if parse_dates:
+        t = (pd.Timestamp("2012-05-16") + pd.to_timedelta(t - 1234, "D")).dt.strftime("%Y-%m-%d")
+    # Series of different lengths, given shuffled, one of them a perfect fit.
+    data = pd.concat(
+        [
+            pd.DataFrame({"org": "A", "measure": 1, "t": t, "y": y}),
+            pd.DataFrame({"org": "A", "measure": 2, "t": t[:-1], "y": y.to_numpy()[::-1][:-1]}),
+            pd.DataFrame({"org": "B", "measure": 1, "t": t, "y": y.index * 2.0}),
+        ]
+    ).sample(frac=1, random_state=1)
+
+    expected = []
+    for (org, measure), series in data.groupby(["org", "measure"]):
+        series = series.sort_values("t").reset_index(drop=True)
+        result = check_tolerance(
+            series["t"],
+            series["y"],
+            to_exclude=to_exclude,
+            poly_features=poly_features,
+            parse_dates=parse_dates,
+            predict_all=predict_all,
+        )
+        result.insert(0, "measure", measure)
+        result.insert(0, "org", org)
+        expected.append(result)
+    obtained = check_tolerance_grouped(
+        data,
+        ["org", "measure"],
+        to_exclude=to_exclude,
+        poly_features=poly_features,
+        parse_dates=parse_dates,
+        predict_all=predict_all,
+    )
+    pdt.assert_frame_equal(pd.concat(expected, ignore_index=True), obtained)
+
+
+@pytest.mark.parametrize("rows, poly_features", [(18, []), (0, [1, 2])])
+def test_grouped_empty(rows, poly_features):
+    t, y = testdata
+    data = pd.DataFrame({"org": ["A"] * 9 + ["B"] * 9, "t": t.tolist() * 2, "y": y.tolist() * 2}).iloc[:rows]
+    obtained = check_tolerance_grouped(data, ["org"], poly_features=poly_features)
+    assert obtained.empty
+    assert list(obtained.columns) == ["org", "t", "yhat_u", "yobs", "yhat", "yhat_l", "polynomial"]
+
+
+@pytest.mark.parametrize(
+    "group_cols, to_exclude, poly_features, alpha, rows_b, exception",
+    [
+        ("org", 2, [2], 0.05, 9, ValueError),  # This should be a list
+        (["org"], 2, "flamingo", 0.05, 9, ValueError),  # This should be a list
+        (["org"], 2, [2], 42, 9, ValueError),  # Needs to be a float
+        (["org"], 2, [2], 1.5, 9, ValueError),  # Needs to be between 0 and 1
+        (["org"], 2, [2], 0.0, 9, ValueError),  # Needs to be between 0 and 1
+        (["org"], "flamingo", [2], 0.05, 9, ValueError),  # Needs to be int
+        (["flamingo"], 2, [2], 0.05, 9, KeyError),  # Needs to be a column
+        (["org"], 2, [42], 0.05, 9, AssertionError),  # Should be between 0 and 4
+        (["org"], 2, [2], 0.05, 5, AssertionError),  # Sample size of B smaller than 4
+    ],
+)
+def test_grouped_errors(group_cols, to_exclude, poly_features, alpha, rows_b, exception):
+    t, y = testdata
+    data = pd.concat(
+        [
+            pd.DataFrame({"org": "A", "t": t, "y": y}),
+            pd.DataFrame({"org": "B", "t": t[:rows_b], "y": y[:rows_b]}),
+        ]
+    )
+    with pytest.raises(exception):
+        check_tolerance_grouped(
+            data, group_cols, to_exclude=to_exclude, poly_features=poly_features, alpha=alpha
+        )
@@ -0,0 +1,22 @@
+from typing import Iterator
+
+import pandas as pd
+
+
+def iter_frames(data) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over the DataFrames in `data`, which is either a DataFrame or an iterable of
+    DataFrames such as the chunks returned by `pd.read_csv` or `tableFromSql` when given a
+    chunksize.
+
+    Validation functions which take chunks combine the results for each chunk as they go,
+    so only one chunk needs to be held in memory at a time.
+    """
+
+    if isinstance(data, pd.DataFrame):
+        yield data
+        return
+    for chunk in data:
+        if not isinstance(chunk, pd.DataFrame):
+            raise ValueError("Please input a DataFrame or an iterable of DataFrames.")
+        yield chunk
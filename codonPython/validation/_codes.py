@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+
+def factorize(column: pd.Series, sort: bool = False) -> tuple:
+    """
+    Integer codes and labels for the values of a column, with code -1 for missing values.
+
+    The codes of a categorical column are used as they are, so low cardinality columns
+    stored as categories are never hashed, and are in category order. Other columns are
+    factorised, with labels sorted if `sort`. The labels of a categorical column may
+    include categories which do not appear.
+    """
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy().astype(np.int64), column.cat.categories
+    codes, labels = pd.factorize(column, sort=sort)
+    return codes.astype(np.int64), labels
+
+
+def presence(first_codes: np.ndarray, second_codes: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Boolean matrix of shape (first labels, second labels) marking which pairs of codes
+    appear together. Pairs with a missing code are left out.
+    """
+
+    known = (first_codes >= 0) & (second_codes >= 0)
+    pairs = first_codes[known] * shape[1] + second_codes[known]
+    return np.bincount(pairs, minlength=shape[0] * shape[1]).reshape(shape) > 0
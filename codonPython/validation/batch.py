@@ -0,0 +1,148 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+def _read_submission(path) -> pd.DataFrame:
+    """Read a CSV or Parquet submission file by its extension."""
+
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == ".csv":
+        return pd.read_csv(path)
+    if extension in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    raise ValueError("Please input CSV or Parquet files, or a reader for the files.")
+
+
+def _error(exception: Exception) -> str:
+    return f"{type(exception).__name__}: {exception}"
+
+
+def _run_submission(submission, checks: dict, reader) -> tuple:
+    """
+    Run each check on one submission, read from its path if need be, catching the
+    errors of each. Returns a (result, error, seconds) tuple for each check, and the
+    wall time of the whole submission.
+    """
+
+    start = time.perf_counter()
+    try:
+        data = submission if isinstance(submission, pd.DataFrame) else reader(submission)
+    except Exception as exception:
+        return [(None, _error(exception), float("nan"))] * len(checks), time.perf_counter() - start
+
+    outcomes = []
+    for check in checks.values():
+        check_start = time.perf_counter()
+        try:
+            outcome = (check(data), None)
+        except Exception as exception:
+            outcome = (None, _error(exception))
+        outcomes.append((*outcome, time.perf_counter() - check_start))
+    return outcomes, time.perf_counter() - start
+
+
+def run_batch(submissions, checks: dict, workers: int = None, reader=None) -> pd.DataFrame:
+    """
+    Run the same checks on many submissions across a pool of worker processes, and
+    collect the results into one summary.
+
+    Each submission is read and checked in one worker, so the files are read in
+    parallel too. An error reading a submission or running a check is recorded in the
+    summary and does not stop the other checks or submissions. Submissions given as
+    DataFrames are copied to the workers, so paths are cheaper for large submissions.
+
+    Checks are sent to the workers with pickle, so they should be functions defined at
+    the top level of a module, or `functools.partial` objects of them, rather than
+    lambdas. Checks which cannot be sent are recorded as errors.
+
+    Parameters
+    ----------
+    submissions : list or dict
+        Paths to submission files or DataFrames, or a dict of them by name. Submissions
+        in a list are named by their path, or their position as a string if a DataFrame.
+    checks : dict
+        Functions taking a submission DataFrame, by name.
+    workers : int, default = None
+        Number of worker processes, as many as there are processors if None. With 1,
+        the submissions are checked one at a time in this process.
+    reader : function, default = None
+        Function reading a DataFrame from a path. CSV and Parquet files are read by their
+        extension if None.
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary with one row for each submission and check, in the order given, and the
+        columns:
+            "submission"         : Name of the submission
+            "check"              : Name of the check
+            "result"             : Value returned by the check, None if it failed
+            "error"              : Type and message of the error, None if there was none
+            "seconds"            : Wall time of the check, NaN if it was not run
+            "submission_seconds" : Wall time of reading and checking the submission, NaN
+                                   if the worker failed
+
+    Examples
+    --------
+    >>> from codonPython.validation.check_consistent_submissions import check_consistent_submissions
+    >>> summary = run_batch(
+    ...   {
+    ...     "provider_a" : pd.DataFrame({
+    ...       "Org_Level" : ["National", "Local", "Local",],
+    ...       "Measure" : ["m1", "m1", "m1",],
+    ...       "Value_Unsuppressed" : [4, 4, 4,],
+    ...     }),
+    ...     "provider_b" : pd.DataFrame({"Org_Level" : ["National",],}),
+    ...   },
+    ...   {"consistent_submissions" : check_consistent_submissions},
+    ...   workers = 1,
+    ... )
+    >>> summary[["submission", "check", "result"]]
+       submission                   check result
+    0  provider_a  consistent_submissions   True
+    1  provider_b  consistent_submissions   None
+    >>> summary.loc[1, "error"]
+    "KeyError: 'Check column names correspond to the DataFrame.'"
+    """
+
+    if isinstance(submissions, dict):
+        names, submissions = list(submissions), list(submissions.values())
+    elif isinstance(submissions, list):
+        names = [
+            str(submission_number) if isinstance(submission, pd.DataFrame) else str(submission)
+            for submission_number, submission in enumerate(submissions)
+        ]
+    else:
+        raise ValueError("Please input a list or dict of submissions.")
+    if not isinstance(checks, dict) or not all(callable(check) for check in checks.values()):
+        raise ValueError("Please input a dict of functions for checks.")
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError("Please input a positive integer for workers.")
+    if reader is None:
+        reader = _read_submission
+
+    if workers == 1:
+        runs = [_run_submission(submission, checks, reader) for submission in submissions]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_submission, submission, checks, reader) for submission in submissions]
+            runs = []
+            for future in futures:
+                # Errors outside the checks, such as a check which cannot be pickled or a
+                # worker which dies, are recorded against the submission.
+                try:
+                    runs.append(future.result())
+                except Exception as exception:
+                    runs.append(([(None, _error(exception), float("nan"))] * len(checks), float("nan")))
+
+    rows = [
+        (name, check_name, result, error, seconds, submission_seconds)
+        for name, (outcomes, submission_seconds) in zip(names, runs)
+        for check_name, (result, error, seconds) in zip(checks, outcomes)
+    ]
+    return pd.DataFrame(
+        rows, columns=["submission", "check", "result", "error", "seconds", "submission_seconds"]
+    )
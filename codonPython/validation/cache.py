@@ -0,0 +1,191 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from codonPython.validation._codes import factorize
+from codonPython.validation.suite import ValidationSuite, _aggregate
+
+# Multiplier mixing the bits of each row hash for the second partition hash.
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+_COLUMNS = ["partition", "geography", "measure", "rows", "count", "sum", "min", "max"]
+
+
+def _row_hashes(data: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Hash of each row of `columns`. String columns are factorised and only their labels
+    hashed, and categorical columns use their codes, as the labels are far fewer than
+    the rows. Missing labels hash to zero.
+    """
+
+    hashes = None
+    for eachColumn in columns:
+        column = data[eachColumn]
+        if pd.api.types.is_numeric_dtype(column.dtype):
+            column_hashes = pd.util.hash_array(column.to_numpy())
+        else:
+            codes, labels = factorize(column)
+            label_hashes = pd.util.hash_array(np.asarray(labels, dtype=object))
+            column_hashes = np.append(label_hashes, np.uint64(0))[codes]
+        hashes = column_hashes if hashes is None else (hashes * _MIX) ^ column_hashes
+    return hashes
+
+
+def _partition_hashes(hashes: np.ndarray, partitions: np.ndarray, count: int) -> np.ndarray:
+    """
+    Content hash of each of `count` partitions from the hashes of its rows, as a hex
+    string. Row hashes are summed, modulo 2**64, both as they are and mixed, so the hash
+    does not depend on the order of the rows.
+    """
+
+    mixed = (hashes ^ (hashes >> np.uint64(31))) * _MIX
+    # Grouping on categories from the partition codes saves factorising them again.
+    sums = (
+        pd.DataFrame({"first": hashes, "second": mixed})
+        .groupby(pd.Categorical.from_codes(partitions, range(count)), observed=False)
+        .sum()
+    )
+    return np.array(
+        [f"{first:016x}{second:016x}" for first, second in sums.itertuples(index=False)],
+        dtype="U32",
+    )
+
+
+class AggregateCache:
+    """
+    On-disk cache of the aggregates behind `ValidationSuite`, for each partition of a
+    dataset, keyed by a content hash of the partition's rows.
+
+    Re-running the consistency checks on a cumulative dataset where only a few
+    partitions, such as the newest period or resubmitting organisations, have changed
+    only aggregates the rows of the partitions whose hash is not in the cache. Their
+    aggregates are combined with the cached ones, and the suite runs
+    `check_consistent_measures`, `check_consistent_submissions` and `check_nat_val` on
+    the result.
+
+    The hash of a partition combines the hashes of its rows over the geography level,
+    measure and value columns, so any change to them is recomputed. The cache keeps the
+    partitions of the last dataset only, and is written to `path` with pickle. Only read
+    caches written by yourself.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cache file. It is created if it does not exist.
+
+    Attributes
+    ----------
+    recomputed : int
+        Number of partitions aggregated from their rows by the last call to `suite`.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> cache = AggregateCache(os.path.join(tempfile.mkdtemp(), "aggregates.pkl"))
+    >>> data = pd.DataFrame({
+    ...   "Period" : ["2020-01", "2020-01", "2020-02", "2020-02",],
+    ...   "Org_Level" : ["National", "Local", "National", "Local",],
+    ...   "Measure" : ["m1", "m1", "m1", "m1",],
+    ...   "Value_Unsuppressed" : [4, 4, 5, 3,],
+    ... })
+    >>> cache.suite(data, ["Period"]).run(["nat_val"])
+    {'nat_val': False}
+    >>> cache.recomputed
+    2
+    >>> data.loc[3, "Value_Unsuppressed"] = 5
+    >>> cache.suite(data, ["Period"]).run(["nat_val"])
+    {'nat_val': True}
+    >>> cache.recomputed
+    1
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.recomputed = 0
+
+    def _load(self) -> pd.DataFrame:
+        if not os.path.exists(self.path):
+            return pd.DataFrame(columns=_COLUMNS)
+        return pd.read_pickle(self.path)
+
+    def suite(
+        self,
+        data: pd.DataFrame,
+        partition_cols: list,
+        geography_col: str = "Org_Level",
+        measure_col: str = "Measure",
+        value_col: str = "Value_Unsuppressed",
+        national_geog_level: str = "National",
+        measures_set: set = set(),
+    ) -> ValidationSuite:
+        """
+        Create a suite for `data`, aggregating only the partitions not in the cache, and
+        update the cache.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            DataFrame of data to check.
+        partition_cols : list
+            Column names whose values split the data into partitions, such as the period
+            or organisation.
+
+        The other parameters are as for `ValidationSuite`.
+
+        Returns
+        -------
+        ValidationSuite
+            Suite on the aggregates of the whole of `data`.
+        """
+
+        if not isinstance(partition_cols, list) or not all(
+            isinstance(col, str) for col in partition_cols
+        ):
+            raise ValueError("Please input a list of strings for partition columns.")
+        columns = [geography_col, measure_col, value_col]
+        if any(col not in data.columns for col in partition_cols + columns):
+            raise KeyError("Check column names correspond to the DataFrame.")
+
+        if len(partition_cols) == 1:
+            partitions, labels = factorize(data[partition_cols[0]])
+            partitions, count = np.where(partitions < 0, len(labels), partitions), len(labels) + 1
+        else:
+            partitions = data.groupby(partition_cols, sort=False, dropna=False).ngroup().to_numpy()
+            count = partitions.max(initial=-1) + 1
+        hashes = _partition_hashes(_row_hashes(data, columns), partitions, count)
+        # Unused categories and missing values leave empty partitions, which are skipped.
+        present = np.flatnonzero(np.bincount(partitions, minlength=count))
+        cached = self._load()
+        cached = cached[np.isin(cached["partition"].to_numpy().astype("U32"), hashes[present])]
+        cached_hashes = cached["partition"].to_numpy().astype("U32")
+
+        # Partitions with the same rows share a hash, so only the first is aggregated.
+        unique_hashes, first = np.unique(hashes[present], return_index=True)
+        changed = present[first[~np.isin(unique_hashes, cached_hashes)]]
+        rows = np.isin(partitions, changed)
+        aggregated = _aggregate(
+            data.loc[rows, columns], geography_col, measure_col, value_col, partitions[rows]
+        )
+        aggregated.columns = _COLUMNS
+        aggregated["partition"] = hashes[aggregated["partition"].to_numpy()]
+        self.recomputed = len(changed)
+
+        frames = [frame for frame in (cached, aggregated) if len(frame)] or [aggregated]
+        entries = pd.concat(frames, ignore_index=True)
+        entries.to_pickle(self.path)
+
+        # Aggregates of partitions sharing a hash are counted once for each partition.
+        copies = entries["partition"].map(pd.Series(hashes[present]).value_counts())
+        entries[["rows", "count", "sum"]] = entries[["rows", "count", "sum"]].mul(copies, axis=0)
+        entries = entries.drop(columns="partition").rename(
+            columns={"geography": geography_col, "measure": measure_col}
+        )
+        return ValidationSuite.from_aggregates(
+            entries,
+            geography_col,
+            measure_col,
+            value_col,
+            national_geog_level,
+            measures_set,
+        )
@@ -1,20 +1,34 @@
 import pandas as pd
 import numpy as np
 
+from codonPython.validation._chunks import iter_frames
+from codonPython.validation._codes import factorize, presence
+from codonPython.validation.result import ValidationResult
+
+# Number of locations of missing values to report.
+_MISSING_SAMPLE = 10
+
 
 def check_consistent_measures(
     data,
     geography_col: str = "Org_Level",
     measure_col: str = "Measure",
     measures_set: set = set(),
-) -> bool:
+    diagnostics: bool = False,
+):
     """
     Check every measure is in every geography level.
 
+    An iterable of DataFrames, such as the chunks from `pd.read_csv` with a chunksize,
+    is checked one chunk at a time, keeping only the measures seen for each geography.
+
+    Missing geography levels or measures raise a ValueError giving how many there are
+    and the (row, column) locations of the first few. Other columns are not looked at.
+
     Parameters
     ----------
-    data : pd.DataFrame
-        DataFrame of data to check.
+    data : pd.DataFrame or iterable of pd.DataFrame
+        DataFrame of data to check, or chunks of one.
     geography_col : str, default = "Org_Level"
         Column name for the geography level.
     measure_col : str, default = "Measure"
@@ -22,11 +36,16 @@ def check_consistent_measures(
     measures_set : set, default = set()
         Set of measures that should be in every geography level. If empty, the existing
         global set is presumed to be correct.
+    diagnostics : bool, default = False
+        Whether to return a ValidationResult, listing each geography level with the wrong
+        measures, rather than a bool.
 
     Returns
     -------
-    bool
-        Whether the checks have been passed.
+    bool or ValidationResult
+        Whether the checks have been passed, and if asked for, the geography levels which
+        failed with the sorted lists of measures they have ("observed") and should have
+        ("expected").
 
     Examples
     --------
@@ -49,22 +68,81 @@ def check_consistent_measures(
     ...   })
     ... )
     False
+    >>> check_consistent_measures(
+    ...   pd.DataFrame({
+    ...     "Org_Level" : ["National" ,"National", "Region", "Region", "Local", "Local",],
+    ...     "Measure" : ["m1", "m3", "m1", "m2", "m1", "m2",],
+    ...     "Value_Unsuppressed" : [4, 2, 2, 1, 2, 1,],
+    ...   }),
+    ...   diagnostics = True,
+    ... ).offending
+      Org_Level  observed      expected
+    0     Local  [m1, m2]  [m1, m2, m3]
+    1  National  [m1, m3]  [m1, m2, m3]
+    2    Region  [m1, m2]  [m1, m2, m3]
     """
 
-    if data.isna().any(axis=None):
-        raise ValueError(
-            f"Missing values at locations {list(map(tuple, np.argwhere(data.isna().values)))}"
-        )
     if not isinstance(geography_col, str) or not isinstance(measure_col, str):
         raise ValueError("Please input strings for column indexes.")
     if not isinstance(measures_set, set):
         raise ValueError("Please input a set object for measures")
-    if geography_col not in data.columns or measure_col not in data.columns:
-        raise KeyError("Check column names correspond to the DataFrame.")
+
+    # Distinct geography and measure pairs, gathered chunk by chunk from the pairs of
+    # codes present rather than from the values themselves.
+    pairs = None
+    rows_seen = 0
+    for chunk in iter_frames(data):
+        if geography_col not in chunk.columns or measure_col not in chunk.columns:
+            raise KeyError("Check column names correspond to the DataFrame.")
+        geography_codes, geographies = factorize(chunk[geography_col])
+        measure_codes, measures = factorize(chunk[measure_col])
+        # Only the two columns used are checked, and only a few locations are reported.
+        missing = np.column_stack([geography_codes < 0, measure_codes < 0])
+        if missing.any():
+            rows, columns = np.nonzero(missing)
+            locations = [
+                (rows_seen + row, [geography_col, measure_col][column])
+                for row, column in zip(rows[:_MISSING_SAMPLE], columns[:_MISSING_SAMPLE])
+            ]
+            raise ValueError(
+                f"{len(rows)} missing values in the geography and measure columns, "
+                f"{'first ' if len(rows) > _MISSING_SAMPLE else ''}at locations {locations}"
+            )
+        geography_present, measure_present = np.nonzero(
+            presence(geography_codes, measure_codes, (len(geographies), len(measures)))
+        )
+        chunk_pairs = pd.DataFrame(
+            {
+                geography_col: geographies[geography_present],
+                measure_col: measures[measure_present],
+            }
+        )
+        pairs = pd.concat([pairs, chunk_pairs], ignore_index=True).drop_duplicates()
+        rows_seen += len(chunk)
+    if pairs is None:
+        pairs = pd.DataFrame(columns=[geography_col, measure_col])
+
+    # Presence matrix of measures, including any in measures_set which never appear, for
+    # each geography level.
+    geography_codes, geographies = pd.factorize(pairs[geography_col], sort=True)
+    measure_codes, measures = pd.factorize(
+        pd.concat([pairs[measure_col], pd.Series(list(measures_set), dtype=object)], ignore_index=True)
+    )
+    matrix = presence(geography_codes, measure_codes[:len(pairs)], (len(geographies), len(measures)))
 
     # Every geography level should have the same set of measures as the global set.
-    global_set = measures_set if measures_set else set(data[measure_col].unique())
-    subsets = data.groupby(geography_col).agg({measure_col: "unique"})
-    subset_agreement = all(set(x) == global_set for x in subsets[measure_col])
+    global_set = measures_set if measures_set else set(measures)
+    expected = np.array([measure in global_set for measure in measures], dtype=bool)
+    agreement = (matrix == expected).all(axis=1)
+    subset_agreement = bool(agreement.all())
 
+    if diagnostics:
+        offending = pd.DataFrame(
+            {
+                geography_col: geographies[~agreement],
+                "observed": [sorted(measures[row]) for row in matrix[~agreement]],
+                "expected": [sorted(global_set)] * int((~agreement).sum()),
+            }
+        )
+        return ValidationResult(subset_agreement, offending)
     return subset_agreement
@@ -1,5 +1,9 @@
 import pandas as pd
 
+from codonPython.validation._chunks import iter_frames
+from codonPython.validation._codes import factorize
+from codonPython.validation.result import ValidationResult
+
 
 def check_consistent_submissions(
     data,
@@ -7,15 +11,20 @@ def check_consistent_submissions(
     geography_col: str = "Org_Level",
     submissions_col: str = "Value_Unsuppressed",
     measure_col: str = "Measure",
-) -> bool:
+    diagnostics: bool = False,
+):
     """
     Check total submissions for each measure are the same across all geography levels
     except national.
 
+    An iterable of DataFrames, such as the chunks from `pd.read_csv` with a chunksize,
+    is checked one chunk at a time, keeping only the distinct submission numbers seen for
+    each measure.
+
     Parameters
     ----------
-    data : pd.DataFrame
-        DataFrame of data to check.
+    data : pd.DataFrame or iterable of pd.DataFrame
+        DataFrame of data to check, or chunks of one.
     national_geog_level : str, default = "National"
         Geography level code for national values.
     geography_col : str, default = "Org_Level"
@@ -24,11 +33,16 @@ def check_consistent_submissions(
         Column name for the submissions count.
     measure_col : str, default = "Measure"
         Column name for measure.
+    diagnostics : bool, default = False
+        Whether to return a ValidationResult, listing each measure with other than one
+        submission number, rather than a bool.
 
     Returns
     -------
-    bool
-        Whether the checks have been passed.
+    bool or ValidationResult
+        Whether the checks have been passed, and if asked for, the measures which failed
+        with the number of distinct submission numbers they have ("observed") and
+        should have ("expected").
 
     Examples
     --------
@@ -52,6 +66,16 @@ def check_consistent_submissions(
     ...   })
     ... )
     False
+    >>> check_consistent_submissions(
+    ...   pd.DataFrame({
+    ...     "Org_Level" : ["National" ,"National", "Region", "Region", "Local", "Local",],
+    ...     "Measure" : ["m1", "m2", "m1", "m2", "m1", "m2",],
+    ...     "Value_Unsuppressed" : [4, 2, 3, 1, 2, 1,],
+    ...   }),
+    ...   diagnostics = True,
+    ... ).offending
+      Measure  observed  expected
+    0      m1         2         1
     """
 
     if (
@@ -63,20 +87,43 @@ def check_consistent_submissions(
         raise ValueError(
             "Please input strings for column names and national geography level."
         )
-    if (
-        submissions_col not in data.columns
-        or measure_col not in data.columns
-        or geography_col not in data.columns
-    ):
-        raise KeyError("Check column names correspond to the DataFrame.")
+
+    # Distinct measure and submission number pairs outside national, chunk by chunk.
+    pairs = None
+    for chunk in iter_frames(data):
+        if (
+            submissions_col not in chunk.columns
+            or measure_col not in chunk.columns
+            or geography_col not in chunk.columns
+        ):
+            raise KeyError("Check column names correspond to the DataFrame.")
+        # Distinct pairs are found on measure codes, leaving out rows without a measure
+        # as grouping would.
+        geography_codes, geographies = factorize(chunk[geography_col])
+        measure_codes, measures = factorize(chunk[measure_col])
+        national_code = geographies.get_indexer([national_geog_level])[0]
+        keep = (measure_codes >= 0) & ((geography_codes != national_code) | (national_code < 0))
+        chunk_pairs = pd.DataFrame(
+            {"code": measure_codes[keep], submissions_col: chunk[submissions_col].to_numpy()[keep]}
+        ).drop_duplicates()
+        chunk_pairs.insert(0, measure_col, measures[chunk_pairs.pop("code").to_numpy()])
+        pairs = pd.concat([pairs, chunk_pairs], ignore_index=True).drop_duplicates()
+    if pairs is None:
+        pairs = pd.DataFrame(columns=[measure_col, submissions_col])
 
     # All non-national measures should have only one unique submission number for each
     # geography level.
-    submissions_by_measure = (
-        data[data[geography_col] != national_geog_level]
-        .groupby(measure_col)
-        .agg({submissions_col: "nunique"})
-    )
-    result = (submissions_by_measure[submissions_col] == 1).all()
+    submissions_by_measure = pairs.groupby(measure_col).agg({submissions_col: "nunique"})
+    agreement = submissions_by_measure[submissions_col] == 1
+    result = agreement.all()
 
+    if diagnostics:
+        offending = pd.DataFrame(
+            {
+                measure_col: submissions_by_measure.index[~agreement],
+                "observed": submissions_by_measure.loc[~agreement, submissions_col].to_numpy(),
+                "expected": 1,
+            }
+        )
+        return ValidationResult(result, offending)
     return result
@@ -1,5 +1,9 @@
 import pandas as pd
 
+from codonPython.validation._chunks import iter_frames
+from codonPython.validation._codes import factorize
+from codonPython.validation.result import ValidationResult
+
 
 def check_nat_val(
     df: pd.DataFrame,
@@ -7,7 +11,8 @@ def check_nat_val(
     measure_col: str = "Measure",
     value_col: str = "Value_Unsuppressed",
     nat_val: str = "National",
-) -> bool:
+    diagnostics: bool = False,
+):
     """
     Check national value less than or equal to sum of breakdowns.
 
@@ -17,10 +22,14 @@ def check_nat_val(
     This function does not apply to values which are percentages calculated
     from the numerator and denominator.
 
+    An iterable of DataFrames, such as the chunks from `pd.read_csv` with a chunksize,
+    is checked one chunk at a time, keeping only a running sum for each measure and
+    breakdown.
+
     Parameters
     ----------
-    df : pandas.DataFrame
-        DataFrame of data to check.
+    df : pandas.DataFrame or iterable of pandas.DataFrame
+        DataFrame of data to check, or chunks of one.
     breakdown_col : str, default = "Breakdown"
         Column name for the breakdown level.
     measure_col : str, default = "Measure"
@@ -29,10 +38,15 @@ def check_nat_val(
         Column name for values
     nat_val : str, default = "National"
         Value in breakdown column denoting national values
+    diagnostics : bool, default = False
+        Whether to return a ValidationResult, listing each measure and breakdown summing
+        to less than the national value, rather than a bool.
     Returns
     -------
-    bool
-        Whether the checks have been passed.
+    bool or ValidationResult
+        Whether the checks have been passed, and if asked for, the measures and
+        breakdowns which failed with their sum ("observed") and the national value it
+        should be at least ("expected"), which is NaN if there is no national value.
 
     Examples
     --------
@@ -68,6 +82,16 @@ def check_nat_val(
     ...   nat_val = "National",
     ... )
     False
+    >>> check_nat_val(
+    ...   df = pd.DataFrame({
+    ...     "Breakdown" : ['National', 'CCG', 'CCG', 'Provider', 'Provider',],
+    ...     "Measure" : ['m1', 'm1', 'm1', 'm1', 'm1',],
+    ...     "Value_Unsuppressed" : [10, 4, 5, 3, 9,],
+    ...   }),
+    ...   diagnostics = True,
+    ... ).offending
+      Measure Breakdown  observed  expected
+    0      m1       CCG         9        10
     """
 
     if (
@@ -78,16 +102,33 @@ def check_nat_val(
         raise ValueError("Please input strings for column indexes.")
     if not isinstance(nat_val, str):
         raise ValueError("Please input strings for value indexes.")
-    if (
-        breakdown_col not in df.columns
-        or measure_col not in df.columns
-        or value_col not in df.columns
-    ):
-        raise KeyError("Check column names correspond to the DataFrame.")
-    # aggregate values by measure and breakdown
-    grouped = (
-        df.groupby([measure_col, breakdown_col]).agg({value_col: sum}).reset_index()
-    )
+    # Running sums by measure and breakdown, added to chunk by chunk. Each chunk is
+    # grouped on one integer code for each pair rather than on the two columns.
+    totals = None
+    for chunk in iter_frames(df):
+        if (
+            breakdown_col not in chunk.columns
+            or measure_col not in chunk.columns
+            or value_col not in chunk.columns
+        ):
+            raise KeyError("Check column names correspond to the DataFrame.")
+        measure_codes, measures = factorize(chunk[measure_col])
+        breakdown_codes, breakdowns = factorize(chunk[breakdown_col])
+        known = (measure_codes >= 0) & (breakdown_codes >= 0)
+        pair_codes = measure_codes[known] * len(breakdowns) + breakdown_codes[known]
+        sums = chunk[value_col][known].groupby(pair_codes).sum()
+        sums.index = pd.MultiIndex.from_arrays(
+            [measures[sums.index // len(breakdowns)], breakdowns[sums.index % len(breakdowns)]],
+            names=[measure_col, breakdown_col],
+        )
+        totals = sums if totals is None else pd.concat([totals, sums]).groupby(level=[0, 1]).sum()
+    if totals is None:
+        totals = pd.Series(
+            [], dtype=float, index=pd.MultiIndex.from_arrays([[], []], names=[measure_col, breakdown_col])
+        )
+
+    # compare national with each breakdown once all the sums are known
+    grouped = totals.sort_index().rename(value_col).reset_index()
     national = grouped.loc[grouped[breakdown_col] == nat_val].reset_index()
     non_national = grouped.loc[grouped[breakdown_col] != nat_val].reset_index()
     # check values are less than or equal to national value for each measure
@@ -98,4 +139,16 @@ def check_nat_val(
     right = value_col + "_y"
     join["Check"] = join[right] <= join[left]
     result = all(join["Check"])
+
+    if diagnostics:
+        failed = join[~join["Check"]]
+        offending = pd.DataFrame(
+            {
+                measure_col: failed[measure_col].to_numpy(),
+                breakdown_col: failed[breakdown_col + "_x"].to_numpy(),
+                "observed": failed[left].to_numpy(),
+                "expected": failed[right].to_numpy(),
+            }
+        )
+        return ValidationResult(result, offending)
     return result
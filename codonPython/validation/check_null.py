@@ -1,18 +1,87 @@
+import os
+
 import numpy
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from codonPython.validation._chunks import iter_frames
+
+
+def _check_columns(column_names, columns_to_be_checked: list):
+    if not isinstance(columns_to_be_checked, list):
+        raise ValueError("Please make sure that all your columns passed are strings")
+
+    for eachCol in columns_to_be_checked:
+        if eachCol not in column_names:
+            raise KeyError(
+                "Please check the column names correspond to values in the DataFrame."
+            )
+
+
+def _null_mask(dataframe: pd.DataFrame, columns_to_be_checked: list) -> numpy.ndarray:
+    """Boolean array of nulls with one row per row and one column per column checked."""
 
+    # A single isna over the selected columns works block by block rather than column
+    # by column.
+    return dataframe[columns_to_be_checked].isna().to_numpy()
 
-def check_null(dataframe: pd.DataFrame, columns_to_be_checked: list) -> int:
+
+def _parquet_null_counts(path, columns_to_be_checked: list) -> numpy.ndarray:
+    """
+    Null counts of the given columns of a Parquet file, from the row group statistics in
+    the file footer where they are recorded.
+
+    Only the row groups and columns without a recorded null count are read. Columns that
+    are not a single leaf in the Parquet schema, such as structs, are always read.
+    """
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    _check_columns(parquet_file.schema_arrow.names, columns_to_be_checked)
+
+    leaves = {metadata.schema.column(j).path: j for j in range(metadata.num_columns)}
+    null_counts = numpy.zeros(len(columns_to_be_checked), dtype=numpy.int64)
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        to_read = []
+        for k, eachColumn in enumerate(columns_to_be_checked):
+            statistics = (
+                row_group.column(leaves[eachColumn]).statistics if eachColumn in leaves else None
+            )
+            if statistics is not None and statistics.has_null_count:
+                null_counts[k] += statistics.null_count
+            else:
+                to_read.append(eachColumn)
+        if to_read:
+            table = parquet_file.read_row_group(i, columns=list(dict.fromkeys(to_read)))
+            for k, eachColumn in enumerate(columns_to_be_checked):
+                if eachColumn in to_read:
+                    null_counts[k] += table.column(eachColumn).null_count
+    return null_counts
+
+
+def check_null(dataframe, columns_to_be_checked: list) -> int:
     """
     Checks a pandas dataframe for null values
 
     This function takes a pandas dataframe supplied as an argument and returns a integer value
     representing any null values found within the columns to check.
 
+    A pyarrow Table or the path to a Parquet file can be given instead. Arrow records the
+    number of nulls in each column, and Parquet files usually record it for each row
+    group in the footer, so these are answered without reading the values. Only the
+    row groups and columns of a Parquet file without these statistics are read. Arrow
+    does not count floating point NaN as null, but NaN in pandas columns written to
+    Arrow or Parquet is stored as null.
+
+    An iterable of DataFrames, such as the chunks from `pd.read_csv` with a chunksize,
+    is checked one chunk at a time.
+
     Parameters
     ----------
-    data : pandas.DataFrame
-        Dataframe to read
+    data : pandas.DataFrame, iterable of pandas.DataFrame, pyarrow.Table or str
+        Dataframe to read, chunks of one, or Arrow table or path to a Parquet file
     columns_to_be_checked: list
         Given dataframe columns to be checked for null values
 
@@ -27,20 +96,90 @@ def check_null(dataframe: pd.DataFrame, columns_to_be_checked: list) -> int:
     0
     >>> check_null(dataframe = pd.DataFrame({'col1': [1,numpy.nan], 'col2': [3,4]}),columns_to_be_checked = ['col1'])
     1
+    >>> check_null(dataframe = pa.table({'col1': [1,None], 'col2': [3,4]}),columns_to_be_checked = ['col1'])
+    1
     """
 
-    if not isinstance(columns_to_be_checked, list):
-        raise ValueError("Please make sure that all your columns passed are strings")
+    if isinstance(dataframe, (str, os.PathLike)):
+        return int(_parquet_null_counts(dataframe, columns_to_be_checked).sum())
 
-    for eachCol in columns_to_be_checked:
-        if eachCol not in dataframe.columns:
-            raise KeyError(
-                "Please check the column names correspond to values in the DataFrame."
-            )
+    if isinstance(dataframe, pa.Table):
+        _check_columns(dataframe.column_names, columns_to_be_checked)
+        return sum(dataframe.column(eachColumn).null_count for eachColumn in columns_to_be_checked)
 
     null_count = 0
-    for eachColumn in columns_to_be_checked:
-        prev_null_count = null_count
-        null_count = prev_null_count + (len(dataframe) - dataframe[eachColumn].count())
+    for chunk in iter_frames(dataframe):
+        _check_columns(chunk.columns, columns_to_be_checked)
+        null_count += int(_null_mask(chunk, columns_to_be_checked).sum())
 
     return null_count
+
+
+def null_profile(dataframe, columns_to_be_checked: list, null_positions: int = 0) -> pd.DataFrame:
+    """
+    Profiles null values in each of the given columns of a pandas dataframe
+
+    All the columns are checked for nulls in a single vectorised pass, giving the number
+    and fraction of nulls in each column and, if asked for, where the first ones are.
+    An iterable of DataFrames is profiled one chunk at a time, with positions counted
+    from the start of the first chunk.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame or iterable of pandas.DataFrame
+        Dataframe to read, or chunks of one
+    columns_to_be_checked : list
+        Given dataframe columns to be checked for null values
+    null_positions : int, default = 0
+        Number of row positions of null values to list for each column, counting from
+        0 at the first row. No positions are listed if 0.
+
+    Returns
+    -------
+    out : pandas.DataFrame
+        One row per column checked, with the columns:
+            "null_count"     : Number of null values
+            "null_fraction"  : Proportion of rows which are null, NaN if there are none
+            "null_positions" : List of the first positions of nulls, if asked for
+
+    Examples
+    --------
+    >>> null_profile(
+    ...     dataframe = pd.DataFrame({'col1': [1,numpy.nan,numpy.nan,4], 'col2': [5,6,7,8]}),
+    ...     columns_to_be_checked = ['col1', 'col2'],
+    ...     null_positions = 1,
+    ... )
+          null_count  null_fraction null_positions
+    col1           2            0.5            [1]
+    col2           0            0.0             []
+    """
+
+    if not isinstance(null_positions, int) or null_positions < 0:
+        raise ValueError("Please input a non-negative integer number of null positions.")
+
+    null_counts = numpy.zeros(len(columns_to_be_checked), dtype=numpy.int64)
+    positions = [[] for _ in columns_to_be_checked]
+    rows_seen = 0
+    for chunk in iter_frames(dataframe):
+        _check_columns(chunk.columns, columns_to_be_checked)
+        mask = _null_mask(chunk, columns_to_be_checked)
+        chunk_counts = mask.sum(axis=0)
+        # Columns still short of positions, with nulls in this chunk.
+        wanted = [
+            k for k, count in enumerate(chunk_counts) if count and len(positions[k]) < null_positions
+        ]
+        if wanted:
+            # Nulls in column order then row order, keeping the first few of each column.
+            columns, rows = numpy.nonzero(mask[:, wanted].T)
+            starts = numpy.searchsorted(columns, numpy.arange(len(wanted)))
+            for k, start in zip(wanted, starts):
+                count = min(chunk_counts[k], null_positions - len(positions[k]))
+                positions[k].extend((rows[start:start + count] + rows_seen).tolist())
+        null_counts += chunk_counts
+        rows_seen += len(chunk)
+
+    profile = pd.DataFrame({"null_count": null_counts}, index=pd.Index(columns_to_be_checked))
+    profile["null_fraction"] = profile["null_count"] / rows_seen
+    if null_positions:
+        profile["null_positions"] = positions
+    return profile
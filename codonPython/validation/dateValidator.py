@@ -1,5 +1,29 @@
 import re
 
+import numpy as np
+import pandas as pd
+
+from codonPython._char_codes import char_codes, code_table
+
+# This regex string will validate dates of type `dd/mm/yyyy`, `dd-mm-yyyy` or `dd.mm.yyyy`
+# from years 1900 - 2049. Leap year support included. Original Regex string based on
+# https://stackoverflow.com/questions/15491894/regex-to-validate-date-format-dd-mm-yyyy
+# modified to confine the year dates.
+_DATE_PATTERN = re.compile(
+    r"^(?:(?:31(\/|-|\.)(?:0?[13578]|1[02]))\1"
+    + r"|(?:(?:29|30)(\/|-|\.)(?:0?[13-9]|1[0-2])\2"
+    + r"))(?:(?:1[9]..|2[0][0-4].))$|^(?:29(\/|-|\.)0?2\3"
+    + r"(?:(?:(?:1[6-9]|[2-9]\d)?(?:0[48]|[2468][048]|[13579][26])|(?:(?:16|[2468][048]"
+    + r"|[3579][26])00))))$|^(?:0?[1-9]|1\d|2[0-8])(\/|-|\.)(?:(?:0?[1-9])|(?:1[0-2]))\4"
+    + r"(?:(?:1[9]..|2[0][0-4].))$"
+)
+
+# Longest string that can be a date: `dd/mm/yyyy` and the trailing newline "$" allows.
+_MAX_DATE_LENGTH = 11
+_DATE_SEPARATORS = code_table([ord("/"), ord("-"), ord(".")])
+# Last day of each month accepted by the pattern, outside of 29th February.
+_LAST_DAYS = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
 
 def validDate(date_string: str) -> bool:
     """
@@ -27,21 +51,188 @@ def validDate(date_string: str) -> bool:
     """
 
     # Let TypeError be.
-
-    # This regex string will validate dates of type `dd/mm/yyyy`, `dd-mm-yyyy` or `dd.mm.yyyy`
-    # from years 1900 - 2049. Leap year support included. Original Regex string based on
-    # https://stackoverflow.com/questions/15491894/regex-to-validate-date-format-dd-mm-yyyy
-    # modified to confine the year dates.
-    if re.match(
-        r"^(?:(?:31(\/|-|\.)(?:0?[13578]|1[02]))\1"
-        + r"|(?:(?:29|30)(\/|-|\.)(?:0?[13-9]|1[0-2])\2"
-        + r"))(?:(?:1[9]..|2[0][0-4].))$|^(?:29(\/|-|\.)0?2\3"
-        + r"(?:(?:(?:1[6-9]|[2-9]\d)?(?:0[48]|[2468][048]|[13579][26])|(?:(?:16|[2468][048]"
-        + r"|[3579][26])00))))$|^(?:0?[1-9]|1\d|2[0-8])(\/|-|\.)(?:(?:0?[1-9])|(?:1[0-2]))\4"
-        + r"(?:(?:1[9]..|2[0][0-4].))$",
-        date_string,
-        flags=0,
-    ):
+    if _DATE_PATTERN.match(date_string):
         return True
     else:
         return False
+
+
+def _string_values(dates: pd.Series) -> np.ndarray:
+    """Object array of the values of `dates`, with anything but strings and missing values blanked."""
+
+    values = dates.to_numpy(dtype=object)
+    # Missing values are read as strings such as "nan" and "None", which are not dates,
+    # so only other types need to be blanked out.
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        strings = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+        values = np.where(strings, values, "")
+    return values
+
+
+def _split_dates(values: np.ndarray) -> tuple:
+    """
+    Split an object array of date strings into day, month and year fields.
+
+    Days and months are one or two digits, and both separators are the same one of "/",
+    "-" or ".". A single trailing newline is ignored, as it is by "$" in the pattern.
+    Returns the day and month, -1 where a string does not split, and the character codes
+    of the first four characters of the year with the year's length.
+    """
+
+    # One row of character codes per string position. Anything longer than a date is cut
+    # to one character more, which is enough to fail.
+    width = _MAX_DATE_LENGTH + 1
+    codes = char_codes(values, width)
+
+    written = codes != 0
+    lengths = np.where(written.any(axis=0), width - np.argmax(written[::-1], axis=0), 0)
+    lengths -= codes[np.maximum(lengths - 1, 0), np.arange(len(values))] == ord("\n")
+
+    digits = codes - np.uint8(ord("0"))
+    is_digit = digits < 10
+    digits = digits.astype(np.int16)
+    day = np.full(len(values), -1, dtype=np.int16)
+    month = np.full(len(values), -1, dtype=np.int16)
+    year_length = np.full(len(values), -1, dtype=np.int64)
+    year_codes = np.zeros((4, len(values)), dtype=np.uint8)
+    for day_length in (1, 2):
+        for month_length in (1, 2):
+            # Positions of the separators for this layout.
+            first, second = day_length, day_length + month_length + 1
+            fits = _DATE_SEPARATORS[codes[first]] & (codes[second] == codes[first])
+            for position in (*range(first), *range(first + 1, second)):
+                fits &= is_digit[position]
+            np.copyto(day, digits[0] * 10 + digits[1] if day_length == 2 else digits[0], where=fits)
+            np.copyto(
+                month,
+                digits[first + 1] * 10 + digits[first + 2] if month_length == 2 else digits[first + 1],
+                where=fits,
+            )
+            np.copyto(year_length, lengths - (second + 1), where=fits)
+            np.copyto(year_codes, codes[second + 1:second + 5], where=fits)
+
+    return day, month, year_codes, year_length
+
+
+def validDates(dates: pd.Series) -> pd.Series:
+    """
+    Validates a column of stringtype dates of type `dd/mm/yyyy`, `dd-mm-yyyy` or
+    `dd.mm.yyyy` in one vectorised pass.
+
+    Accepts exactly the strings `validDate` accepts, but works on arrays of character
+    codes for the whole column rather than matching a regex row by row. Missing and
+    non-string values are not valid.
+
+    Parameters
+    ----------
+    dates : pd.Series
+        Dates to be validated
+
+    Returns
+    ----------
+    pd.Series
+        Boolean mask of whether each date is valid, with the same index as `dates`
+
+    Examples
+    ---------
+    >>> validDates(pd.Series(["11/02/1996", "29/02/2016", "43/01/1996", None])).tolist()
+    [True, True, False, False]
+    """
+
+    day, month, year_codes, year_length = _split_dates(_string_values(dates))
+
+    # Four characters starting 19 or 200-204, as in the pattern any character other
+    # than a newline may follow.
+    year_digits = year_codes - np.uint8(ord("0"))
+    in_range = (year_length == 4) & (year_codes[2] != ord("\n")) & (year_codes[3] != ord("\n")) & (
+        ((year_digits[0] == 1) & (year_digits[1] == 9))
+        | ((year_digits[0] == 2) & (year_digits[1] == 0) & (year_digits[2] <= 4))
+    )
+    in_month = (month >= 1) & (month <= 12) & (day >= 1) & (day <= _LAST_DAYS[np.clip(month, 0, 12)])
+
+    valid = in_range & in_month
+
+    # 29th February is checked against leap years separately, with two digit years or
+    # any four digit year from 1600.
+    feb_29 = np.flatnonzero((day == 29) & (month == 2))
+    year_digits, year_length = year_digits[:, feb_29].astype(np.int64), year_length[feb_29]
+    numeric_year = (year_digits[:2] < 10).all(axis=0) & (
+        (year_length == 2) | ((year_length == 4) & (year_digits[2:] < 10).all(axis=0))
+    )
+    century = year_digits[0] * 10 + year_digits[1]
+    last_two = np.where(year_length == 4, year_digits[2] * 10 + year_digits[3], century)
+    leap = (last_two % 4 == 0) & ((last_two != 0) | ((year_length == 4) & (century % 4 == 0)))
+    valid[feb_29] = leap & numeric_year & ((year_length == 2) | (century >= 16))
+    return pd.Series(valid, index=dates.index, name=dates.name)
+
+
+def parseDates(dates: pd.Series, min_year: int = 1900, max_year: int = 2049) -> tuple:
+    """
+    Parses and validates a column of stringtype dates of type `dd/mm/yyyy`, `dd-mm-yyyy`
+    or `dd.mm.yyyy` in one vectorised pass, without a regex.
+
+    Days and months may be one or two digits and years must be four digits between
+    `min_year` and `max_year`. Each date must exist in the calendar, so 29th February is
+    only valid in leap years. Missing and non-string values are not valid.
+
+    Parameters
+    ----------
+    dates : pd.Series
+        Dates to be parsed
+    min_year : int, default = 1900
+        Earliest year accepted, from 1678.
+    max_year : int, default = 2049
+        Latest year accepted, up to 2261.
+
+    Returns
+    ----------
+    tuple
+        pd.Series of datetime64[ns] dates with NaT where not valid, and a boolean mask of
+        whether each date is valid, both with the same index as `dates`
+
+    Examples
+    ---------
+    >>> parsed, valid = parseDates(pd.Series(["11/02/1996", "29.2.2016", "29/02/2017"]))
+    >>> parsed.tolist()
+    [Timestamp('1996-02-11 00:00:00'), Timestamp('2016-02-29 00:00:00'), NaT]
+    >>> valid.tolist()
+    [True, True, False]
+    """
+
+    # Years which fit in datetime64[ns].
+    for year in (min_year, max_year):
+        if not isinstance(year, int) or not 1678 <= year <= 2261:
+            raise ValueError("Please input years between 1678 and 2261.")
+    if min_year > max_year:
+        raise ValueError("min_year should not be after max_year.")
+
+    day, month, year_codes, year_length = _split_dates(_string_values(dates))
+    year_digits = year_codes.astype(np.int64) - ord("0")
+    year = ((year_digits[0] * 10 + year_digits[1]) * 10 + year_digits[2]) * 10 + year_digits[3]
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    valid = (
+        (year_length == 4)
+        & ((year_digits >= 0) & (year_digits < 10)).all(axis=0)
+        & (year >= min_year)
+        & (year <= max_year)
+        & (month >= 1)
+        & (month <= 12)
+        & (day >= 1)
+        & (day <= _LAST_DAYS[np.clip(month, 0, 12)] + (leap & (month == 2)))
+    )
+
+    # Days since 1970-01-01 from the civil date, counting years from March so that leap
+    # days fall at the end. Howard Hinnant's days_from_civil, for years after 0.
+    month = month.astype(np.int64)
+    year -= month <= 2
+    year_of_era = year % 400
+    day_of_year = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = (year // 400) * 146097 + day_of_era - 719468
+
+    parsed = np.where(valid, days, 0).astype("M8[D]").astype("M8[ns]")
+    parsed[~valid] = np.datetime64("NaT")
+    return (
+        pd.Series(parsed, index=dates.index, name=dates.name),
+        pd.Series(valid, index=dates.index, name=dates.name),
+    )
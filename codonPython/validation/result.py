@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of a validation check, with what made it fail.
+
+    A result is truthy exactly when the check passed, so it can be used wherever the
+    bool returned by the check would be.
+
+    Parameters
+    ----------
+    passed : bool
+        Whether the check has been passed.
+    offending : pd.DataFrame
+        One row for each key which failed the check, with the key columns followed by
+        the values which failed it, usually "observed" and "expected" columns. Empty if
+        the check passed.
+
+    Examples
+    --------
+    >>> result = ValidationResult(False, pd.DataFrame({"Measure": ["m1"], "observed": [2], "expected": [1]}))
+    >>> bool(result)
+    False
+    >>> result.offending
+      Measure  observed  expected
+    0      m1         2         1
+    """
+
+    passed: bool
+    offending: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    def __bool__(self) -> bool:
+        return bool(self.passed)
@@ -0,0 +1,310 @@
+import numpy as np
+import pandas as pd
+
+from codonPython.validation._codes import factorize
+from codonPython.validation.result import ValidationResult
+
+
+def _aggregate(
+    data: pd.DataFrame,
+    geography_col: str,
+    measure_col: str,
+    value_col: str,
+    partitions: np.ndarray = None,
+) -> pd.DataFrame:
+    """
+    Aggregate table of the value column by geography level and measure, laid out as
+    `ValidationSuite.aggregates`. If `partitions` holds an integer code for each row, the
+    values are aggregated by partition as well, in a leading "partition" column.
+    """
+
+    # Codes for each geography level and measure, combined into one code for the
+    # pair, so that the values are grouped on integers only once. Categorical columns
+    # are not factorised again.
+    geography_codes, geographies = factorize(data[geography_col])
+    measure_codes, measures = factorize(data[measure_col])
+    pair_codes, pairs = pd.factorize((geography_codes + 1) * (len(measures) + 1) + measure_codes + 1)
+    group_codes, groups = pair_codes, None
+    if partitions is not None:
+        # Each partition and pair is one code in turn, split back apart once grouped.
+        pair_count = max(len(pairs), 1)
+        group_codes, groups = pd.factorize(np.asarray(partitions, dtype=np.int64) * pair_count + pair_codes)
+        pairs = pairs[groups % pair_count]
+    values = data[value_col].reset_index(drop=True)
+    aggregates = values.groupby(group_codes, sort=False).agg(["size", "count", "sum", "min", "max"])
+
+    # Missing geography levels and measures have code -1, which reindexing fills with NaN.
+    keys = {
+        geography_col: pd.Series(geographies).reindex(pairs // (len(measures) + 1) - 1).to_numpy(),
+        measure_col: pd.Series(measures).reindex(pairs % (len(measures) + 1) - 1).to_numpy(),
+    }
+    if partitions is not None:
+        keys = {"partition": groups // pair_count, **keys}
+    aggregates.index = pd.MultiIndex.from_arrays(list(keys.values()), names=list(keys))
+    return aggregates.rename(columns={"size": "rows"}).reset_index()
+
+
+class ValidationSuite:
+    """
+    Run the consistency checks on a submission from one shared set of aggregates.
+
+    `check_consistent_measures`, `check_consistent_submissions` and `check_nat_val` each
+    group the data by geography level and measure. The suite factorises those two
+    columns and aggregates the value column by the pair a single time, then runs every
+    registered check against the aggregates.
+
+    The aggregates are held in `aggregates`, a DataFrame with one row for each geography
+    level and measure that appears in the data, and the columns:
+        geography_col : Geography level, NaN for rows missing one
+        measure_col   : Measure, NaN for rows missing one
+        "rows"        : Number of rows
+        "count"       : Number of non-null values
+        "sum"         : Sum of the values
+        "min"         : Smallest value, NaN if there are none
+        "max"         : Largest value, NaN if there are none
+    Aggregates for parts of a submission can be concatenated and passed to
+    `from_aggregates`, which combines them by summing rows, count and sum and taking the
+    min and max over each geography level and measure.
+
+    Checks are functions of the suite returning whether the check passed, registered
+    under a name with `register`. A subclass starts with the checks registered on its
+    parent when it is defined, and the checks registered on the subclass apply to it
+    alone. The registered checks return a ValidationResult naming the offending
+    geography levels or measures. They are:
+        "consistent_measures"    : Every measure is in every geography level, as in
+                                   `check_consistent_measures`, raising ValueError if
+                                   a geography level or measure is missing
+        "consistent_submissions" : Each measure has one value across all geography
+                                   levels except national, as in
+                                   `check_consistent_submissions`. The aggregates
+                                   do not keep the distinct values, so the offending
+                                   measures have "min" and "max" columns with the
+                                   smallest and largest value, rather than the
+                                   function's "observed" and "expected"
+        "nat_val"                : The national value is less than or equal to the sum
+                                   for each other geography level, as in `check_nat_val`
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame of data to check.
+    geography_col : str, default = "Org_Level"
+        Column name for the geography level or breakdown.
+    measure_col : str, default = "Measure"
+        Column name for measure.
+    value_col : str, default = "Value_Unsuppressed"
+        Column name for the values or submissions count.
+    national_geog_level : str, default = "National"
+        Geography level code for national values.
+    measures_set : set, default = set()
+        Set of measures that should be in every geography level. If empty, the existing
+        global set is presumed to be correct.
+
+    Examples
+    --------
+    >>> suite = ValidationSuite(
+    ...   pd.DataFrame({
+    ...     "Org_Level" : ["National", "National", "Region", "Region", "Local", "Local",],
+    ...     "Measure" : ["m1", "m2", "m1", "m2", "m1", "m2",],
+    ...     "Value_Unsuppressed" : [4, 1, 4, 1, 4, 1,],
+    ...   })
+    ... )
+    >>> suite.run()
+    {'consistent_measures': True, 'consistent_submissions': True, 'nat_val': True}
+    >>> suite.aggregates
+      Org_Level Measure  rows  count  sum  min  max
+    0  National      m1     1      1    4    4    4
+    1  National      m2     1      1    1    1    1
+    2    Region      m1     1      1    4    4    4
+    3    Region      m2     1      1    1    1    1
+    4     Local      m1     1      1    4    4    4
+    5     Local      m2     1      1    1    1    1
+    """
+
+    checks = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each subclass starts from a copy of its parent's checks, so the checks it
+        # registers are not run by the parent.
+        cls.checks = dict(cls.checks)
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        geography_col: str = "Org_Level",
+        measure_col: str = "Measure",
+        value_col: str = "Value_Unsuppressed",
+        national_geog_level: str = "National",
+        measures_set: set = set(),
+    ):
+        self._set_columns(geography_col, measure_col, value_col, national_geog_level, measures_set)
+        if (
+            geography_col not in data.columns
+            or measure_col not in data.columns
+            or value_col not in data.columns
+        ):
+            raise KeyError("Check column names correspond to the DataFrame.")
+
+        self.aggregates = _aggregate(data, geography_col, measure_col, value_col)
+
+    def _set_columns(self, geography_col, measure_col, value_col, national_geog_level, measures_set):
+        if (
+            not isinstance(geography_col, str)
+            or not isinstance(measure_col, str)
+            or not isinstance(value_col, str)
+            or not isinstance(national_geog_level, str)
+        ):
+            raise ValueError(
+                "Please input strings for column names and national geography level."
+            )
+        if not isinstance(measures_set, set):
+            raise ValueError("Please input a set object for measures")
+        self.geography_col = geography_col
+        self.measure_col = measure_col
+        self.value_col = value_col
+        self.national_geog_level = national_geog_level
+        self.measures_set = measures_set
+
+    @classmethod
+    def from_aggregates(
+        cls,
+        aggregates: pd.DataFrame,
+        geography_col: str = "Org_Level",
+        measure_col: str = "Measure",
+        value_col: str = "Value_Unsuppressed",
+        national_geog_level: str = "National",
+        measures_set: set = set(),
+    ) -> "ValidationSuite":
+        """
+        Create a suite from an aggregate table, such as the aggregates of several suites
+        concatenated, without the data it came from.
+
+        Parameters
+        ----------
+        aggregates : pd.DataFrame
+            Aggregate table laid out as `ValidationSuite.aggregates`. Rows for the same
+            geography level and measure are combined.
+
+        The other parameters are as for `ValidationSuite`.
+        """
+
+        suite = cls.__new__(cls)
+        suite._set_columns(geography_col, measure_col, value_col, national_geog_level, measures_set)
+        columns = [geography_col, measure_col, "rows", "count", "sum", "min", "max"]
+        if any(column not in aggregates.columns for column in columns):
+            raise KeyError("Check column names correspond to the aggregate table.")
+        suite.aggregates = (
+            aggregates.groupby([geography_col, measure_col], sort=False, dropna=False)
+            .agg({"rows": "sum", "count": "sum", "sum": "sum", "min": "min", "max": "max"})
+            .reset_index()
+        )
+        return suite
+
+    @classmethod
+    def register(cls, name: str):
+        """
+        Decorator registering a check under `name`. A check is a function of the suite
+        returning a bool or a ValidationResult.
+        """
+
+        def decorator(check):
+            cls.checks[name] = check
+            return check
+
+        return decorator
+
+    def run(self, checks: list = None, diagnostics: bool = False) -> dict:
+        """
+        Run the registered checks.
+
+        Parameters
+        ----------
+        checks : list, default = None
+            Names of the checks to run. All registered checks are run if None.
+        diagnostics : bool, default = False
+            Whether to return a ValidationResult for each check rather than a bool. The
+            offending keys come from the aggregates, at no extra cost.
+
+        Returns
+        -------
+        dict
+            Whether each check has been passed, or its ValidationResult, by name.
+        """
+
+        if checks is None:
+            checks = list(self.checks)
+        for name in checks:
+            if name not in self.checks:
+                raise KeyError(f"No check registered as {name}.")
+
+        results = {}
+        for name in checks:
+            result = self.checks[name](self)
+            if not isinstance(result, ValidationResult):
+                result = ValidationResult(bool(result))
+            results[name] = result if diagnostics else bool(result)
+        return results
+
+
+@ValidationSuite.register("consistent_measures")
+def _consistent_measures(suite: ValidationSuite) -> ValidationResult:
+    aggregates = suite.aggregates
+    if aggregates[[suite.geography_col, suite.measure_col]].isna().any(axis=None):
+        raise ValueError("Missing values in the geography or measure columns.")
+
+    # Every geography level should have the same set of measures as the global set.
+    global_set = suite.measures_set if suite.measures_set else set(aggregates[suite.measure_col])
+    subsets = aggregates.groupby(suite.geography_col, sort=False)[suite.measure_col].agg(set)
+    failed = subsets[[subset != global_set for subset in subsets]]
+    offending = pd.DataFrame(
+        {
+            suite.geography_col: failed.index,
+            "observed": [sorted(subset) for subset in failed],
+            "expected": [sorted(global_set)] * len(failed),
+        }
+    )
+    return ValidationResult(len(failed) == 0, offending)
+
+
+@ValidationSuite.register("consistent_submissions")
+def _consistent_submissions(suite: ValidationSuite) -> ValidationResult:
+    aggregates = suite.aggregates
+    non_national = aggregates[aggregates[suite.geography_col] != suite.national_geog_level]
+
+    # All non-national values of a measure should be the same, so there should be at
+    # least one and the smallest should equal the largest.
+    by_measure = non_national.groupby(suite.measure_col, sort=False).agg(
+        {"count": "sum", "min": "min", "max": "max"}
+    )
+    agreement = (by_measure["count"] > 0) & (by_measure["min"] == by_measure["max"])
+    # The smallest and largest values are reported, both NaN if there are none.
+    offending = pd.DataFrame(
+        {
+            suite.measure_col: by_measure.index[~agreement],
+            "min": by_measure.loc[~agreement, "min"].to_numpy(),
+            "max": by_measure.loc[~agreement, "max"].to_numpy(),
+        }
+    )
+    return ValidationResult(bool(agreement.all()), offending)
+
+
+@ValidationSuite.register("nat_val")
+def _nat_val(suite: ValidationSuite) -> ValidationResult:
+    aggregates = suite.aggregates.dropna(subset=[suite.geography_col, suite.measure_col])
+    is_national = aggregates[suite.geography_col] == suite.national_geog_level
+    national = aggregates.loc[is_national].set_index(suite.measure_col)["sum"]
+    non_national = aggregates.loc[~is_national]
+
+    # Measures without a national value compare as NaN, and fail.
+    expected = non_national[suite.measure_col].map(national)
+    agreement = expected <= non_national["sum"]
+    offending = pd.DataFrame(
+        {
+            suite.measure_col: non_national.loc[~agreement, suite.measure_col].to_numpy(),
+            suite.geography_col: non_national.loc[~agreement, suite.geography_col].to_numpy(),
+            "observed": non_national.loc[~agreement, "sum"].to_numpy(),
+            "expected": expected[~agreement].to_numpy(),
+        }
+    )
+    return ValidationResult(bool(agreement.all()), offending)
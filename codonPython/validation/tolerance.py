@@ -4,6 +4,7 @@ from datetime import datetime
 from sklearn.preprocessing import StandardScaler, PolynomialFeatures
 from sklearn.pipeline import make_pipeline
 import statsmodels.api as sm
+from scipy import stats
 from statsmodels.sandbox.regression.predstd import wls_prediction_std
 
 
@@ -98,7 +99,8 @@ def check_tolerance(
     t = t[idx]
     y = y[idx]
 
-    results = pd.DataFrame()
+    # Results for each degree are collected as arrays and put into one frame at the end.
+    results = []
     for degree in poly_features:
         transforms = make_pipeline(StandardScaler(), PolynomialFeatures(degree=degree))
 
@@ -121,19 +123,193 @@ def check_tolerance(
         # Calculate prediction intervals of fitted model.
         _, yhat_l, yhat_u = wls_prediction_std(model, t_predict, alpha=alpha)
 
-        # Store model results in master frame
-        results = results.append(
-            pd.DataFrame(
-                {
-                    "t": t_orig,
-                    "yhat_u": yhat_u,
-                    "yobs": y_predict,
-                    "yhat": yhat,
-                    "yhat_l": yhat_l,
-                    "polynomial": degree,
-                }
-            ),
-            ignore_index=True,
+        # Store model results for this degree
+        results.append(
+            (t_orig.to_numpy(), yhat_u, y_predict.to_numpy(), yhat, yhat_l, np.full(len(t_orig), degree))
         )
 
+    if not results:
+        return pd.DataFrame()
+    names = ["t", "yhat_u", "yobs", "yhat", "yhat_l", "polynomial"]
+    return pd.DataFrame({name: np.concatenate(column) for name, column in zip(names, zip(*results))})
+
+
+def _predict_intervals(
+    t_scaled: np.ndarray, y: np.ndarray, train: int, degree: int, alpha: float
+) -> tuple:
+    """
+    Fit an ordinary least squares polynomial of `degree` to the first `train` points of
+    each of a stack of series, and predict every point with its prediction interval.
+
+    `t_scaled` and `y` are of shape (series, points). The fit uses the pseudo-inverse of
+    the design matrix as statsmodels' OLS does, and the intervals are as given by
+    `wls_prediction_std`, so each series matches `check_tolerance`. Returns the upper,
+    predicted and lower values, each of shape (series, points).
+    """
+
+    design = t_scaled[..., np.newaxis] ** np.arange(degree + 1)
+    design_train, y_train = design[:, :train], y[:, :train]
+
+    # Pseudo-inverse from the singular value decomposition of each design matrix, with
+    # singular values below rcond = 1e-15 of the largest treated as zero.
+    u, s, vt = np.linalg.svd(design_train, full_matrices=False)
+    largest = s.max(axis=1, keepdims=True)
+    s_inv = np.divide(1.0, s, out=np.zeros_like(s), where=s > 1e-15 * largest)
+    pinv = np.swapaxes(vt, 1, 2) @ (s_inv[..., np.newaxis] * np.swapaxes(u, 1, 2))
+    params = (pinv @ y_train[..., np.newaxis])[..., 0]
+    normalized_cov = pinv @ np.swapaxes(pinv, 1, 2)
+
+    # Residual degrees of freedom from the rank, as numpy's matrix_rank of the singular values.
+    rank = (s > largest * s.shape[1] * np.finfo(s.dtype).eps).sum(axis=1)
+    df_resid = train - rank
+    residuals = y_train - (design_train @ params[..., np.newaxis])[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = (residuals ** 2).sum(axis=1) / df_resid
+
+    yhat = (design @ params[..., np.newaxis])[..., 0]
+    leverage = np.einsum("gnp,gpq,gnq->gn", design, normalized_cov, design)
+    predstd = np.sqrt(scale[:, np.newaxis] * (1 + leverage))
+    tppf = stats.t.isf(alpha / 2.0, df_resid)[:, np.newaxis]
+    return yhat + tppf * predstd, yhat, yhat - tppf * predstd
+
+
+def check_tolerance_grouped(
+    data: pd.DataFrame,
+    group_cols: list,
+    t_col: str = "t",
+    y_col: str = "y",
+    to_exclude: int = 1,
+    poly_features: list = [1, 2],
+    alpha: float = 0.05,
+    parse_dates: bool = False,
+    predict_all: bool = False,
+) -> pd.DataFrame:
+    """
+    Run `check_tolerance` on each series in a long DataFrame of many series.
+
+    Rather than fitting one model for each series, series of the same length are
+    stacked, and the least squares fits and prediction intervals for each degree are
+    solved for the whole stack at once with batched linear algebra.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        DataFrame with one row for each time point of each series.
+    group_cols : list
+        Column names identifying each series, such as organisation and measure.
+    t_col : str, default = "t"
+        Column name for the time points.
+    y_col : str, default = "y"
+        Column name for the response variable values.
+
+    The other parameters are as for `check_tolerance`, applied to each series.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame containing the group columns followed by the columns returned by
+        `check_tolerance`, for each series in turn, ordered by the group columns.
+
+    Examples
+    --------
+    >>> check_tolerance_grouped(
+    ...     pd.DataFrame({
+    ...         "org" : ["A"] * 6 + ["B"] * 6,
+    ...         "t" : [1001,1002,1003,1004,1005,1006] * 2,
+    ...         "y" : [2,3,4,4.5,5,5.1,1,2.5,3,4,4.8,6.5],
+    ...     }),
+    ...     group_cols = ["org"],
+    ...     to_exclude = 2,
+    ...     poly_features = [1],
+    ... )
+      org     t    yhat_u  yobs  yhat    yhat_l  polynomial
+    0   A  1005  6.817413   5.0  5.50  4.182587           1
+    1   A  1006  7.952702   5.1  6.35  4.747298           1
+    2   B  1005  7.012382   4.8  5.00  2.987618           1
+    3   B  1006  8.398168   6.5  5.95  3.501832           1
+    """
+
+    if not isinstance(group_cols, list) or not all(isinstance(col, str) for col in group_cols):
+        raise ValueError("Please input a list of strings for group_cols.")
+    if any(col not in data.columns for col in group_cols + [t_col, y_col]):
+        raise KeyError("Check column names correspond to the DataFrame.")
+    if not isinstance(poly_features, list):
+        raise ValueError(
+            "Please input a list of integers from 0 to 4 for poly_features."
+        )
+    assert all(
+        0 <= degree <= 4 for degree in poly_features
+    ), "Please ensure all numbers in poly_features are from 0 to 4."
+    if not isinstance(alpha, float) or not 0 < alpha < 1:
+        raise ValueError("Please input a float between 0 and 1 for alpha.")
+    if not isinstance(to_exclude, int):
+        raise ValueError(
+            "Please input an integer between 1 and your sample size for to_exclude."
+        )
+    assert data[y_col].notna().all(), "Your sample contains missing values for y. Exclude these values to continue."
+    assert data[t_col].notna().all(), "Your sample contains missing values for t. Exclude these values to continue."
+
+    # Convert date strings to numeric variables for the model
+    if parse_dates:
+        t_numeric = (pd.to_datetime(data[t_col]) - datetime(1970, 1, 1)).dt.days.to_numpy(dtype=float)
+    else:
+        t_numeric = data[t_col].to_numpy(dtype=float)
+    y = data[y_col].to_numpy(dtype=float)
+
+    # Sort the rows by series, then by t within each series.
+    groups = data.groupby(group_cols, sort=True, dropna=False).ngroup().to_numpy()
+    order = np.lexsort((t_numeric, groups))
+    sizes = np.bincount(groups)
+    starts = np.cumsum(sizes) - sizes
+    assert (
+        (sizes - to_exclude) >= 4
+    ).all(), """The sample size for some of your models is smaller than 4. This will not produce a good
+        model. Either reduce to_exclude or increase the sample size of every series to continue."""
+
+    # Each series of the same length is fitted together, and each prediction kept with
+    # its series, degree and position so that the results can be put in order at the end.
+    parts = []
+    for size in np.unique(sizes):
+        series = np.flatnonzero(sizes == size)
+        rows = order[starts[series, np.newaxis] + np.arange(size)]
+        train = size - to_exclude
+        t_train = t_numeric[rows[:, :train]]
+
+        # Standardise t with the mean and standard deviation of the training data.
+        scale = t_train.std(axis=1, keepdims=True)
+        scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0
+        t_scaled = (t_numeric[rows] - t_train.mean(axis=1, keepdims=True)) / scale
+
+        predicted = slice(None) if predict_all else slice(train, None)
+        for degree_number, degree in enumerate(poly_features):
+            yhat_u, yhat, yhat_l = _predict_intervals(t_scaled, y[rows], train, degree, alpha)
+            points = rows[:, predicted]
+            parts.append(
+                (
+                    np.repeat(series, points.shape[1]),
+                    np.full(points.size, degree_number),
+                    points.ravel(),
+                    yhat_u[:, predicted].ravel(),
+                    yhat[:, predicted].ravel(),
+                    yhat_l[:, predicted].ravel(),
+                )
+            )
+
+    if not parts:
+        # No series or no degrees, so the results are empty but keep their columns.
+        indices, values = np.empty(0, dtype=np.int64), np.empty(0)
+        parts = [(indices, indices, indices, values, values, values)]
+    series, degree_number, points, yhat_u, yhat, yhat_l = (
+        np.concatenate(column) for column in zip(*parts)
+    )
+    # Sorting is stable, so points stay in order of t within each series and degree.
+    result_order = np.lexsort((degree_number, series))
+    points = points[result_order]
+    results = data[group_cols].iloc[points].reset_index(drop=True)
+    results["t"] = data[t_col].to_numpy()[points]
+    results["yhat_u"] = yhat_u[result_order]
+    results["yobs"] = y[points]
+    results["yhat"] = yhat[result_order]
+    results["yhat_l"] = yhat_l[result_order]
+    results["polynomial"] = np.asarray(poly_features, dtype=np.int64)[degree_number[result_order]]
     return results
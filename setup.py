@@ -9,6 +9,7 @@ setup(
     license='BSD',
     packages=find_packages(),
     install_requires=requirements,
+    python_requires='>=3.8',
     author='NHS Digital DIS Team',
     author_email='paul.ellingham@nhs.net',
     url='https://digital.nhs.uk/data-and-information',